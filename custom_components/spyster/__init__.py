@@ -23,6 +23,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Store config entry data
         hass.data[DOMAIN]["config"] = entry.data
 
+        # Story 3.3: Preload location packs at startup. Runs before any view
+        # is registered so every request sees parsed, validated, indexed packs
+        from .game.content import preload_location_packs
+        await preload_location_packs(hass)
+
         # Initialize game state (Story 1.2)
         game_state = GameState()
         hass.data[DOMAIN]["game_state"] = game_state
@@ -35,7 +40,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.http.register_view(HostView())
         hass.http.register_view(PlayerView())
         hass.http.register_view(SpysterQRView(game_state))
-        hass.http.register_view(SpysterWebSocketView(hass, game_state))
+        ws_view = SpysterWebSocketView(hass, game_state)
+        hass.data[DOMAIN]["ws_handler"] = ws_view.handler
+        hass.http.register_view(ws_view)
         _LOGGER.info(
             "Registered HTTP views: /api/spyster/host, /api/spyster/player, /api/spyster/qr, /api/spyster/ws"
         )
@@ -43,10 +50,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Register static file paths
         register_static_paths(hass)
 
-        # Story 3.3: Preload location packs at startup
-        from .game.content import preload_location_packs
-        await preload_location_packs(hass)
-
         _LOGGER.info("Spyster integration setup complete")
         return True
     except Exception as err:
@@ -63,6 +66,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         game_state = hass.data[DOMAIN]["game_state"]
         game_state.cancel_all_timers()
 
+    # Stop pending broadcasts and background sends
+    if DOMAIN in hass.data and "ws_handler" in hass.data[DOMAIN]:
+        await hass.data[DOMAIN]["ws_handler"].shutdown()
+
     # Clean up integration data
     if DOMAIN in hass.data:
         hass.data.pop(DOMAIN)
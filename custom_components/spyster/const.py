@@ -9,6 +9,12 @@ CONF_PORT = "port"
 
 # WebSocket configuration (ARCH-15)
 WS_HEARTBEAT_TIMEOUT = 30  # seconds - aiohttp keepalive
+WS_MAX_MSG_SIZE = 64 * 1024  # bytes - largest client frame accepted
+WS_RECEIVE_TIMEOUT = 120  # seconds - close clients silent this long (heartbeat is 10s)
+LOBBY_BROADCAST_DELAY = 0.05  # seconds - coalesce join/reconnect bursts
+BROADCAST_SEND_TIMEOUT = 5.0  # seconds - per-client cap on a state send
+TIMER_TICK_SLACK = 0.01  # seconds - wake just past each timer second boundary
+OUTBOUND_QUEUE_SIZE = 32  # frames buffered per client before it is dropped as too slow
 
 # Error codes foundation (expand in future stories)
 ERR_INVALID_MESSAGE = "INVALID_MESSAGE"
@@ -1,7 +1,6 @@
 """Game configuration management."""
 import logging
 from dataclasses import dataclass, asdict
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -19,6 +18,7 @@ from ..const import (
     ERR_CONFIG_INVALID_ROUNDS,
     ERR_CONFIG_INVALID_PACK,
 )
+from .content import pack_exists
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,37 +38,63 @@ class GameConfig:
         Returns:
             (valid, error_code) - True if valid, otherwise False with error code
         """
-        # Validate round duration
-        if not (CONFIG_MIN_ROUND_DURATION <= self.round_duration_minutes <= CONFIG_MAX_ROUND_DURATION):
+        for field, check in _FIELD_CHECKS.items():
+            error = check(self, getattr(self, field))
+            if error:
+                return False, error
+
+        return True, None
+
+    def validate_field(self, field: str, value: int | str) -> tuple[bool, str | None]:
+        """
+        Validate a single configuration value without touching the others.
+
+        Args:
+            field: Configuration field name
+            value: Candidate value (already coerced to the field's type)
+
+        Returns:
+            (valid, error_code) - True if valid, otherwise False with error code
+        """
+        error = _FIELD_CHECKS[field](self, value)
+        if error:
+            return False, error
+        return True, None
+
+    def _check_round_duration(self, value: int) -> str | None:
+        """Return an error code if the round duration is out of range."""
+        if not (CONFIG_MIN_ROUND_DURATION <= value <= CONFIG_MAX_ROUND_DURATION):
             _LOGGER.warning(
                 "Invalid round duration: %d (min: %d, max: %d)",
-                self.round_duration_minutes,
+                value,
                 CONFIG_MIN_ROUND_DURATION,
                 CONFIG_MAX_ROUND_DURATION
             )
-            return False, ERR_CONFIG_INVALID_DURATION
+            return ERR_CONFIG_INVALID_DURATION
+        return None
 
-        # Validate number of rounds
-        if not (CONFIG_MIN_ROUNDS <= self.num_rounds <= CONFIG_MAX_ROUNDS):
+    def _check_num_rounds(self, value: int) -> str | None:
+        """Return an error code if the number of rounds is out of range."""
+        if not (CONFIG_MIN_ROUNDS <= value <= CONFIG_MAX_ROUNDS):
             _LOGGER.warning(
                 "Invalid number of rounds: %d (min: %d, max: %d)",
-                self.num_rounds,
+                value,
                 CONFIG_MIN_ROUNDS,
                 CONFIG_MAX_ROUNDS
             )
-            return False, ERR_CONFIG_INVALID_ROUNDS
+            return ERR_CONFIG_INVALID_ROUNDS
+        return None
 
-        # Validate location pack exists
-        if not self._pack_exists(self.location_pack):
-            _LOGGER.warning("Location pack not found: %s", self.location_pack)
-            return False, ERR_CONFIG_INVALID_PACK
-
-        return True, None
+    def _check_location_pack(self, value: str) -> str | None:
+        """Return an error code if the location pack does not exist."""
+        if not self._pack_exists(value):
+            _LOGGER.warning("Location pack not found: %s", value)
+            return ERR_CONFIG_INVALID_PACK
+        return None
 
     def _pack_exists(self, pack_id: str) -> bool:
-        """Check if location pack file exists."""
-        pack_file = Path(__file__).parent.parent / "content" / f"{pack_id}.json"
-        exists = pack_file.exists()
+        """Check if location pack is loaded or its file exists."""
+        exists = pack_exists(pack_id)
         _LOGGER.debug("Location pack check: %s - %s", pack_id, "exists" if exists else "not found")
         return exists
 
@@ -84,3 +110,11 @@ class GameConfig:
             num_rounds=data.get("num_rounds", CONFIG_DEFAULT_ROUNDS),
             location_pack=data.get("location_pack", CONFIG_DEFAULT_LOCATION_PACK),
         )
+
+
+# Field name -> validator, in the order validate() reports errors
+_FIELD_CHECKS = {
+    "round_duration_minutes": GameConfig._check_round_duration,
+    "num_rounds": GameConfig._check_num_rounds,
+    "location_pack": GameConfig._check_location_pack,
+}
@@ -1,20 +1,42 @@
 """Content pack loading and management."""
 from __future__ import annotations
 
-import json
+import asyncio
+from dataclasses import dataclass
 import logging
 from pathlib import Path
 import secrets
 from typing import TYPE_CHECKING, TypedDict
 
+import orjson
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bundled pack files live in <integration>/content; set_content_dir() can
+# point loading elsewhere
+_DEFAULT_CONTENT_DIR = Path(__file__).parent.parent / "content"
+_CONTENT_DIR = _DEFAULT_CONTENT_DIR
+
 # Cache loaded packs
 _LOADED_PACKS: dict[str, "LocationPack"] = {}
 
+# Read-only lookup views built once per pack (see _install_pack)
+_PACK_INDEX: dict[str, "_PackIndex"] = {}
+
+# Required fields for validate_location_pack; pack fields stay a tuple so
+# errors keep their order, role fields are a set for a one-shot subset check
+_PACK_REQUIRED_FIELDS = ("id", "name", "locations")
+_ROLE_REQUIRED_FIELDS = frozenset(("id", "name", "hint"))
+
+# Parsed, validated pack files keyed by (path, mtime_ns); an edited file
+# gets a new key, so stale entries are never served
+_FILE_CACHE: dict[tuple[str, int], "LocationPack"] = {}
+
 
 # Type definitions for location pack structure (Story 8-2: AC1)
 class Role(TypedDict):
@@ -46,6 +68,47 @@ class ContentValidationError(Exception):
     pass
 
 
+@dataclass(slots=True, frozen=True)
+class _PackIndex:
+    """Precomputed views over a loaded pack's locations.
+
+    Built once when the pack is cached so per-round lookups are single dict
+    hits instead of walks over the locations list. Treat as read-only.
+    """
+    locations: tuple[Location, ...]
+    summaries: tuple[dict[str, str], ...]
+    by_id: dict[str, Location]
+    roles_by_location: dict[str, tuple[Role, ...]]
+
+
+def _install_pack(pack_id: str, pack_data: LocationPack) -> None:
+    """Cache a pack and build its lookup index.
+
+    Args:
+        pack_id: Pack identifier
+        pack_data: Parsed (and validated) pack data
+    """
+    locations = tuple(pack_data.get("locations", []))
+    summaries = []
+    by_id = {}
+    roles_by_location = {}
+
+    # One pass fills every column view
+    for loc in locations:
+        loc_id = loc.get("id")
+        summaries.append({"id": loc_id, "name": loc.get("name")})
+        by_id[loc_id] = loc
+        roles_by_location[loc_id] = tuple(loc.get("roles", []))
+
+    _LOADED_PACKS[pack_id] = pack_data
+    _PACK_INDEX[pack_id] = _PackIndex(
+        locations=locations,
+        summaries=tuple(summaries),
+        by_id=by_id,
+        roles_by_location=roles_by_location,
+    )
+
+
 def validate_location_pack(pack_data: dict, pack_id: str) -> list[str]:
     """Validate a location pack structure (Story 8-2: AC2).
 
@@ -59,8 +122,7 @@ def validate_location_pack(pack_data: dict, pack_id: str) -> list[str]:
     errors: list[str] = []
 
     # Required top-level fields (version is optional but recommended)
-    required_fields = ["id", "name", "locations"]
-    for field in required_fields:
+    for field in _PACK_REQUIRED_FIELDS:
         if field not in pack_data:
             errors.append(f"Pack '{pack_id}' missing required field: {field}")
 
@@ -79,8 +141,9 @@ def validate_location_pack(pack_data: dict, pack_id: str) -> list[str]:
     if len(locations) < 1:
         errors.append(f"Pack '{pack_id}' must have at least 1 location")
 
-    # Validate each location
+    # Validate each location (single pass; ids and names must be unique)
     location_ids = set()
+    location_names = set()
     for i, location in enumerate(locations):
         loc_prefix = f"Pack '{pack_id}' location[{i}]"
 
@@ -94,6 +157,10 @@ def validate_location_pack(pack_data: dict, pack_id: str) -> list[str]:
 
         if "name" not in location:
             errors.append(f"{loc_prefix} missing 'name' field")
+        elif location["name"] in location_names:
+            errors.append(f"{loc_prefix} duplicate name: {location['name']}")
+        else:
+            location_names.add(location["name"])
 
         if "roles" not in location:
             errors.append(f"{loc_prefix} missing 'roles' field")
@@ -111,6 +178,11 @@ def validate_location_pack(pack_data: dict, pack_id: str) -> list[str]:
         # Validate each role
         role_ids = set()
         for j, role in enumerate(roles):
+            # Fast path: complete role with a fresh id needs no messages
+            if role.keys() >= _ROLE_REQUIRED_FIELDS and role["id"] not in role_ids:
+                role_ids.add(role["id"])
+                continue
+
             role_prefix = f"{loc_prefix} role[{j}]"
 
             if "id" not in role:
@@ -129,30 +201,36 @@ def validate_location_pack(pack_data: dict, pack_id: str) -> list[str]:
     return errors
 
 
-def load_location_pack(hass: HomeAssistant, pack_id: str) -> LocationPack | None:
-    """Load a location pack from JSON file.
+def _read_pack_file(pack_id: str) -> LocationPack | None:
+    """Read, parse and validate a pack file without touching the pack cache.
+
+    Safe to run in an executor thread; callers install the result.
 
     Args:
-        hass: Home Assistant instance
         pack_id: Pack identifier (e.g., "classic")
 
     Returns:
         Pack data dict or None if not found/invalid
     """
-    if pack_id in _LOADED_PACKS:
-        return _LOADED_PACKS[pack_id]
-
-    # Construct path to content file
-    integration_dir = Path(__file__).parent.parent
-    content_file = integration_dir / "content" / f"{pack_id}.json"
+    content_file = _CONTENT_DIR / f"{pack_id}.json"
 
-    if not content_file.exists():
+    try:
+        key = (str(content_file), content_file.stat().st_mtime_ns)
+    except FileNotFoundError:
         _LOGGER.error("Location pack not found: %s", content_file)
         return None
+    except OSError as err:
+        _LOGGER.error("Failed to load location pack %s: %s", pack_id, err)
+        return None
 
-    try:
-        with open(content_file, "r", encoding="utf-8") as f:
-            pack_data = json.load(f)
+    pack_data = _FILE_CACHE.get(key)
+    if pack_data is None:
+        try:
+            # orjson parses the raw bytes directly, skipping the text decode
+            pack_data = orjson.loads(content_file.read_bytes())
+        except (orjson.JSONDecodeError, OSError) as err:
+            _LOGGER.error("Failed to load location pack %s: %s", pack_id, err)
+            return None
 
         # Validate pack structure (Story 8-2: AC2)
         validation_errors = validate_location_pack(pack_data, pack_id)
@@ -161,20 +239,40 @@ def load_location_pack(hass: HomeAssistant, pack_id: str) -> LocationPack | None
                 _LOGGER.error(error)
             return None
 
-        # Cache the pack
-        _LOADED_PACKS[pack_id] = pack_data
+        _FILE_CACHE[key] = pack_data
 
-        _LOGGER.info(
-            "Loaded location pack: %s (%d locations)",
-            pack_data.get("name", pack_id),
-            len(pack_data["locations"])
-        )
+    return pack_data
 
-        return pack_data
 
-    except (json.JSONDecodeError, OSError) as err:
-        _LOGGER.error("Failed to load location pack %s: %s", pack_id, err)
-        return None
+def _cache_loaded_pack(pack_id: str, pack_data: LocationPack) -> None:
+    """Install a freshly read pack and log it."""
+    _install_pack(pack_id, pack_data)
+
+    _LOGGER.info(
+        "Loaded location pack: %s (%d locations)",
+        pack_data.get("name", pack_id),
+        len(pack_data["locations"])
+    )
+
+
+def load_location_pack(hass: HomeAssistant, pack_id: str) -> LocationPack | None:
+    """Load a location pack from JSON file.
+
+    Args:
+        hass: Home Assistant instance
+        pack_id: Pack identifier (e.g., "classic")
+
+    Returns:
+        Pack data dict or None if not found/invalid
+    """
+    if pack_id in _LOADED_PACKS:
+        return _LOADED_PACKS[pack_id]
+
+    pack_data = _read_pack_file(pack_id)
+    if pack_data is not None:
+        _cache_loaded_pack(pack_id, pack_data)
+
+    return pack_data
 
 
 def get_random_location(pack_id: str) -> Location | None:
@@ -195,30 +293,30 @@ def get_random_location(pack_id: str) -> Location | None:
             "No location packs loaded - call preload_location_packs() during integration setup"
         )
 
-    pack = _LOADED_PACKS.get(pack_id)
+    index = _PACK_INDEX.get(pack_id)
 
-    if not pack:
+    if not index:
         _LOGGER.error("Location pack not found: %s (available: %s)", pack_id, list(_LOADED_PACKS.keys()))
         return None
 
-    if not pack.get("locations"):
+    if not index.locations:
         _LOGGER.error("Location pack %s has no locations", pack_id)
         return None
 
-    # Use CSPRNG for location selection
-    location = secrets.choice(pack["locations"])
+    # Use CSPRNG for location selection; direct indexing skips choice()'s
+    # extra length check and method dispatch on a per-round path
+    locations = index.locations
+    return locations[secrets.randbelow(len(locations))]
 
-    return location
 
-
-def get_location_list(pack_id: str) -> list[dict[str, str]]:
+def get_location_list(pack_id: str) -> Sequence[dict[str, str]]:
     """Get list of all locations in a pack with id and name (for spy display).
 
     Args:
         pack_id: Pack identifier
 
     Returns:
-        List of location dicts with 'id' and 'name' keys
+        Sequence of location dicts with 'id' and 'name' keys (shared, read-only)
 
     Raises:
         RuntimeError: If pack is not preloaded (critical setup error)
@@ -229,16 +327,45 @@ def get_location_list(pack_id: str) -> list[dict[str, str]]:
             "No location packs loaded - call preload_location_packs() during integration setup"
         )
 
-    pack = _LOADED_PACKS.get(pack_id)
+    index = _PACK_INDEX.get(pack_id)
 
-    if not pack or not pack.get("locations"):
+    if not index or not index.summaries:
         _LOGGER.error("Location pack not loaded: %s", pack_id)
         return []
 
-    return [{"id": loc["id"], "name": loc["name"]} for loc in pack["locations"]]
+    return index.summaries
+
+
+def pack_exists(pack_id: str) -> bool:
+    """Check whether a pack is loaded or has a file in the content directory.
+
+    Loaded packs answer from memory, so repeated config validation of the
+    active pack never touches the filesystem.
+
+    Args:
+        pack_id: Pack identifier
+
+    Returns:
+        True if the pack is available
+    """
+    return pack_id in _LOADED_PACKS or (_CONTENT_DIR / f"{pack_id}.json").exists()
+
+
+def location_exists(pack_id: str, location_id: str) -> bool:
+    """Check whether a location id belongs to a loaded pack.
 
+    Args:
+        pack_id: Pack identifier
+        location_id: Location identifier
 
-def get_roles_for_location(pack_id: str, location_id: str) -> list[Role]:
+    Returns:
+        True if the pack is loaded and contains the location
+    """
+    index = _PACK_INDEX.get(pack_id)
+    return index is not None and location_id in index.by_id
+
+
+def get_roles_for_location(pack_id: str, location_id: str) -> Sequence[Role]:
     """Get all roles for a specific location (Story 8-2: AC3).
 
     Args:
@@ -246,24 +373,24 @@ def get_roles_for_location(pack_id: str, location_id: str) -> list[Role]:
         location_id: Location identifier
 
     Returns:
-        List of Role dicts for the location, or empty list if not found
+        Role dicts for the location (read-only), or empty list if not found
     """
     if not _LOADED_PACKS:
         raise RuntimeError(
             "No location packs loaded - call preload_location_packs() during integration setup"
         )
 
-    pack = _LOADED_PACKS.get(pack_id)
-    if not pack:
+    index = _PACK_INDEX.get(pack_id)
+    if not index:
         _LOGGER.error("Location pack not found: %s", pack_id)
         return []
 
-    for location in pack.get("locations", []):
-        if location.get("id") == location_id:
-            return location.get("roles", [])
+    roles = index.roles_by_location.get(location_id)
+    if roles is None:
+        _LOGGER.error("Location not found: %s in pack %s", location_id, pack_id)
+        return []
 
-    _LOGGER.error("Location not found: %s in pack %s", location_id, pack_id)
-    return []
+    return roles
 
 
 def assign_roles_for_location(
@@ -273,8 +400,9 @@ def assign_roles_for_location(
 ) -> list[Role]:
     """Assign roles to players for a given location (Story 8-2: AC4).
 
-    Uses CSPRNG to randomly select and shuffle roles for the given number
-    of non-spy players (player_count - 1, since one player is the spy).
+    Uses CSPRNG to randomly select distinct roles, in random order, for the
+    given number of non-spy players (player_count - 1, since one player is
+    the spy).
 
     Args:
         pack_id: Pack identifier (for logging)
@@ -296,16 +424,9 @@ def assign_roles_for_location(
             f"but needs {non_spy_count} for {player_count} players"
         )
 
-    # Use CSPRNG to shuffle and select roles
-    shuffled_roles = list(roles)  # Create a copy
-
-    # Fisher-Yates shuffle using secrets for cryptographic randomness
-    for i in range(len(shuffled_roles) - 1, 0, -1):
-        j = secrets.randbelow(i + 1)
-        shuffled_roles[i], shuffled_roles[j] = shuffled_roles[j], shuffled_roles[i]
-
-    # Return the first non_spy_count roles
-    assigned_roles = shuffled_roles[:non_spy_count]
+    # CSPRNG (os.urandom-backed) sample: a partial shuffle that only draws
+    # non_spy_count picks and leaves the cached roles untouched
+    assigned_roles = secrets.SystemRandom().sample(roles, non_spy_count)
 
     _LOGGER.debug(
         "Assigned %d roles for location '%s': %s",
@@ -332,38 +453,61 @@ def get_location_by_id(pack_id: str, location_id: str) -> Location | None:
             "No location packs loaded - call preload_location_packs() during integration setup"
         )
 
-    pack = _LOADED_PACKS.get(pack_id)
-    if not pack:
+    index = _PACK_INDEX.get(pack_id)
+    if not index:
         return None
 
-    for location in pack.get("locations", []):
-        if location.get("id") == location_id:
-            return location
+    return index.by_id.get(location_id)
+
 
-    return None
+def _list_pack_ids() -> list[str] | None:
+    """List pack ids in the content directory, or None if it is missing."""
+    if not _CONTENT_DIR.is_dir():
+        return None
+
+    # All .json files are packs except the schema file
+    return [
+        json_file.stem
+        for json_file in _CONTENT_DIR.glob("*.json")
+        if json_file.name != "schema.json"
+    ]
 
 
 async def preload_location_packs(hass: HomeAssistant) -> None:
     """Preload all location packs at integration startup.
 
-    Should be called from async_setup_entry.
+    The directory scan and pack file reads run in the executor (reads
+    concurrently); results are installed back on the event loop. Should be
+    called from async_setup_entry.
     """
-    integration_dir = Path(__file__).parent.parent
-    content_dir = integration_dir / "content"
-
-    if not content_dir.exists():
-        _LOGGER.warning("Content directory not found: %s", content_dir)
+    pack_ids = await hass.async_add_executor_job(_list_pack_ids)
+    if pack_ids is None:
+        _LOGGER.warning("Content directory not found: %s", _CONTENT_DIR)
         return
 
-    # Load all .json files in content directory
-    for json_file in content_dir.glob("*.json"):
-        if json_file.name == "schema.json":
-            continue  # Skip schema file
+    results = await asyncio.gather(*(
+        hass.async_add_executor_job(_read_pack_file, pack_id)
+        for pack_id in pack_ids
+    ))
 
-        pack_id = json_file.stem
-        await hass.async_add_executor_job(load_location_pack, hass, pack_id)
+    for pack_id, pack_data in zip(pack_ids, results):
+        if pack_data is not None:
+            _cache_loaded_pack(pack_id, pack_data)
+
+
+def set_content_dir(content_dir: Path | None) -> None:
+    """Load packs from another directory and drop anything already cached.
+
+    Args:
+        content_dir: Directory holding pack files, or None for the bundled one
+    """
+    global _CONTENT_DIR
+    _CONTENT_DIR = content_dir if content_dir is not None else _DEFAULT_CONTENT_DIR
+    clear_cache()
 
 
 def clear_cache() -> None:
-    """Clear the loaded packs cache (for testing)."""
+    """Clear the loaded packs and parsed file caches (for testing)."""
     _LOADED_PACKS.clear()
+    _PACK_INDEX.clear()
+    _FILE_CACHE.clear()
@@ -4,7 +4,7 @@ import logging
 import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
-from time import time
+from time import monotonic, time
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
@@ -29,7 +29,7 @@ class PlayerSession:
         vote_confidence: Confidence level (1-3)
         score: Current score
         joined_at: Timestamp when player joined
-        last_heartbeat: Last activity timestamp
+        last_heartbeat: Last activity time (time.monotonic())
     """
 
     name: str
@@ -43,9 +43,12 @@ class PlayerSession:
     vote_confidence: int = 1
     score: int = 0
     joined_at: datetime = field(default_factory=datetime.now)
-    last_heartbeat: datetime = field(default_factory=datetime.now)
+    last_heartbeat: float = field(default_factory=monotonic)
     disconnect_timer: Optional[asyncio.Task] = None  # Story 2.4: Grace timer reference
     disconnected_at: Optional[float] = None  # Story 2.6: Timestamp when player disconnected (time.time())
+    # Cached disconnect_grace timer name and the player name it was built for
+    _grace_timer_name: str = field(default="", init=False, repr=False, compare=False)
+    _grace_timer_owner: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def create_new(cls, name: str, is_host: bool = False) -> "PlayerSession":
@@ -65,9 +68,21 @@ class PlayerSession:
         session_token = secrets.token_urlsafe(32)  # 256 bits of entropy
         return cls(name=name, session_token=session_token, is_host=is_host)
 
+    @property
+    def disconnect_timer_name(self) -> str:
+        """Name of this player's disconnect grace timer (Story 2.4).
+
+        Built once and reused by every disconnect/heartbeat; rebuilt only if
+        the player is renamed (host joining as a player).
+        """
+        if self._grace_timer_owner is not self.name:
+            self._grace_timer_name = f"disconnect_grace:{self.name}"
+            self._grace_timer_owner = self.name
+        return self._grace_timer_name
+
     def update_heartbeat(self) -> None:
         """Update last heartbeat timestamp."""
-        self.last_heartbeat = datetime.now()
+        self.last_heartbeat = monotonic()
 
     def disconnect(self) -> None:
         """Mark player as disconnected and record timestamp (Story 2.4/2.6).
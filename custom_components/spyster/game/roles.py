@@ -147,7 +147,8 @@ def assign_roles(game_state: GameState) -> None:
         if player.connected and name != game_state.spy_name
     ]
 
-    available_roles = list(game_state.current_location["roles"])
+    # Pack data is shared and read-only; choice() only reads, so no copy
+    available_roles = game_state.current_location["roles"]
 
     # Validate that location has roles
     if not available_roles:
@@ -1,5 +1,6 @@
 """Game state management for Spyster."""
 import asyncio
+from collections.abc import Sequence
 import logging
 from enum import Enum
 from typing import Any, Awaitable, Callable
@@ -25,6 +26,13 @@ class GamePhase(Enum):
     PAUSED = "PAUSED"
 
 
+# Story 4.2: Phases with a running countdown that clients tick every second
+_TIMED_PHASES = frozenset({GamePhase.QUESTIONING, GamePhase.VOTE})
+
+# Phases whose get_state() carries no per-player fields
+_SHARED_STATE_PHASES = frozenset({GamePhase.LOBBY, GamePhase.REVEAL})
+
+
 class GameState:
     """Manages game state and phase transitions.
 
@@ -45,6 +53,10 @@ class GameState:
         Story 2.3 adds: sessions dictionary for token-based lookup
         """
         # Story 1.1 fields (already implemented)
+        # Story 4.2: Set while in a timed phase so the timer broadcast loop
+        # can sleep on it instead of polling (kept in sync by the phase setter)
+        self._timed_phase_event = asyncio.Event()
+        self.in_timed_phase: bool = False
         self.phase: GamePhase = GamePhase.LOBBY
         self._timers: dict[str, asyncio.Task] = {}
         self.players: dict[str, Any] = {}  # PlayerSession objects (populated in Story 2.3)
@@ -90,6 +102,8 @@ class GameState:
 
         # Story 3.1: Add GameConfig instance (location_pack stored in config.location_pack)
         self.config = GameConfig()
+        self._num_rounds: int = DEFAULT_ROUND_COUNT
+        self._sync_config()
 
         # Game state
         self.current_round: int = 0
@@ -115,6 +129,25 @@ class GameState:
         except Exception as err:
             _LOGGER.debug("Error cleaning up GameState: %s", err)
 
+    @property
+    def phase(self) -> GamePhase:
+        """Get current game phase."""
+        return self._phase
+
+    @phase.setter
+    def phase(self, value: GamePhase) -> None:
+        """Set game phase and update the timed-phase flag (Story 4.2)."""
+        self._phase = value
+        self.in_timed_phase = value in _TIMED_PHASES
+        if self.in_timed_phase:
+            self._timed_phase_event.set()
+        else:
+            self._timed_phase_event.clear()
+
+    async def wait_for_timed_phase(self) -> None:
+        """Wait until the game enters a timed phase (QUESTIONING or VOTE)."""
+        await self._timed_phase_event.wait()
+
     # Story 3.3: Properties for role assignment fields
     @property
     def spy_name(self) -> str | None:
@@ -151,6 +184,25 @@ class GameState:
         """Get location pack ID from config."""
         return self.config.location_pack
 
+    @property
+    def real_player_count(self) -> int:
+        """Get number of players, excluding the host display observer.
+
+        O(1): the host display is normally kept out of players entirely, so
+        this only has to discount a stray "HostDisplay" entry.
+        """
+        return len(self.players) - ("HostDisplay" in self.players)
+
+    def _sync_config(self) -> None:
+        """Normalize config values once when config is assigned or updated.
+
+        Keeps hot paths (e.g. start_game) free of getattr/fallback checks.
+        """
+        from ..const import DEFAULT_ROUND_COUNT
+
+        num_rounds = getattr(self.config, "num_rounds", DEFAULT_ROUND_COUNT)
+        self._num_rounds = num_rounds if num_rounds >= 1 else DEFAULT_ROUND_COUNT
+
     def start_timer(
         self, name: str, duration: float, callback: Callable[[str], Awaitable[None]]
     ) -> None:
@@ -443,25 +495,24 @@ class GameState:
             _LOGGER.warning("Cannot update config: game already started (phase: %s)", self.phase)
             return False, ERR_CONFIG_GAME_STARTED
 
-        # Update field
-        if field == "round_duration_minutes":
-            self.config.round_duration_minutes = int(value)
-        elif field == "num_rounds":
-            self.config.num_rounds = int(value)
+        # Coerce to the field's type
+        if field in ("round_duration_minutes", "num_rounds"):
+            value = int(value)
         elif field == "location_pack":
-            self.config.location_pack = str(value)
+            value = str(value)
         else:
             _LOGGER.warning("Unknown config field: %s", field)
             return False, ERR_INVALID_MESSAGE
 
-        # Validate new configuration
-        valid, error = self.config.validate()
+        # Validate only the touched field (the others were checked when set);
+        # an invalid value is rejected and the current config is kept
+        valid, error = self.config.validate_field(field, value)
         if not valid:
-            # Revert to defaults if invalid
-            self.config = GameConfig()
             _LOGGER.warning("Config validation failed: %s", error)
             return False, error
 
+        setattr(self.config, field, value)
+        self._sync_config()
         _LOGGER.info("Configuration updated: %s = %s", field, value)
         return True, None
 
@@ -601,10 +652,7 @@ class GameState:
             if for_player and for_player == self._spy_name:
                 state["is_spy"] = True
                 state["can_guess_location"] = not self.spy_action_taken
-                state["location_list"] = [
-                    {"id": loc.get("id"), "name": loc.get("name")}
-                    for loc in self._get_location_list()
-                ]
+                state["location_list"] = list(self._get_location_list())
             elif for_player:
                 state["is_spy"] = False
 
@@ -716,6 +764,17 @@ class GameState:
 
         return state
 
+    def is_state_shared(self) -> bool:
+        """Check whether get_state() is identical for every player right now.
+
+        LOBBY and REVEAL carry no per-player fields, so broadcasts in these
+        phases can build and serialize the state once for all connections.
+
+        Returns:
+            True if the current phase has no personalized state
+        """
+        return self._phase in _SHARED_STATE_PHASES
+
     def _determine_winner(self) -> dict:
         """
         Determine the winner(s) of the game (Story 6.7).
@@ -771,6 +830,18 @@ class GameState:
 
         return stats
 
+    def get_active_timer_remaining(self) -> float | None:
+        """Get remaining seconds on the running round or vote timer (Story 4.2).
+
+        Returns:
+            Remaining seconds as float, or None if neither timer is running
+        """
+        for timer_name in ("round", "vote"):
+            task = self._timers.get(timer_name)
+            if task and not task.done():
+                return self._get_timer_remaining(timer_name)
+        return None
+
     def _get_timer_remaining(self, timer_name: str) -> float:
         """Get remaining seconds for a named timer (Story 4.2).
 
@@ -966,8 +1037,9 @@ class GameState:
             return False, ERR_SPY_ALREADY_ACTED
 
         # Validate location exists
-        location_list = self._get_location_list()
-        if location_id not in [loc.get("id") for loc in location_list]:
+        from .content import location_exists
+
+        if not location_exists(self.config.location_pack, location_id):
             _LOGGER.warning("Invalid location guess: %s", location_id)
             return False, ERR_INVALID_LOCATION
 
@@ -994,12 +1066,11 @@ class GameState:
 
         return True, None
 
-    def _get_location_list(self) -> list[dict]:
-        """Get list of possible locations for spy (Story 5.4)."""
+    def _get_location_list(self) -> Sequence[dict]:
+        """Get id/name list of possible locations for spy (Story 5.4)."""
         try:
-            from .content import get_location_pack
-            pack = get_location_pack(self.config.location_pack)
-            return pack.get("locations", [])
+            from .content import get_location_list
+            return get_location_list(self.config.location_pack)
         except Exception as err:
             _LOGGER.warning("Failed to get location pack: %s", err)
             return []
@@ -1376,7 +1447,7 @@ class GameState:
         player_token = player.session_token
 
         # Cancel timers atomically - both must be cancelled before checking player existence
-        grace_timer = f"disconnect_grace:{player_name}"
+        grace_timer = player.disconnect_timer_name
         reconnect_timer = f"reconnect_window:{player_name}"
 
         # Cancel both timers in quick succession to minimize race window
@@ -1510,7 +1581,7 @@ class GameState:
             return False, ERR_SESSION_EXPIRED, None
 
         # Cancel disconnect_grace timer if still running (Story 2.5)
-        self.cancel_timer(f"disconnect_grace:{session.name}")
+        self.cancel_timer(session.disconnect_timer_name)
 
         # Reconnect session
         session.reconnect(ws)
@@ -1584,7 +1655,7 @@ class GameState:
         )
 
         # Cancel disconnect_grace timer if still running
-        self.cancel_timer(f"disconnect_grace:{player_name}")
+        self.cancel_timer(player.disconnect_timer_name)
 
         # Remove from both dictionaries
         self.sessions.pop(player.session_token, None)
@@ -1774,23 +1845,23 @@ class GameState:
         _LOGGER.info("Vote timer expired - processing abstentions")
 
         # Mark non-voters as abstain (AC3)
-        connected_players = [
-            name for name, player in self.players.items() if player.connected
-        ]
-
-        for player_name in connected_players:
-            if player_name not in self.votes:
-                # Check if this is the spy who guessed (Story 5.4)
-                if self.spy_guess and player_name == self._spy_name:
-                    continue  # Spy guessed location, not abstaining
-
-                self.votes[player_name] = {
-                    "target": None,
-                    "confidence": 0,
-                    "abstained": True,
-                    "timestamp": time.time(),
-                }
-                _LOGGER.info("Player %s abstained (timeout)", player_name)
+        # Spy who guessed the location is not abstaining (Story 5.4)
+        spy_name = self._spy_name if self.spy_guess else None
+        now = time.time()
+
+        for player_name, player in self.players.items():
+            if not player.connected or player_name in self.votes:
+                continue
+            if player_name == spy_name:
+                continue
+
+            self.votes[player_name] = {
+                "target": None,
+                "confidence": 0,
+                "abstained": True,
+                "timestamp": now,
+            }
+            _LOGGER.info("Player %s abstained (timeout)", player_name)
 
         votes_cast = len([v for v in self.votes.values() if not v.get("abstained")])
         abstentions = len([v for v in self.votes.values() if v.get("abstained")])
@@ -1941,11 +2012,8 @@ class GameState:
             # FIX #5: Use imported constant (ARCH-19)
             return False, ERR_ROLE_ASSIGNMENT_FAILED
 
-        # FIX #4: Validate config or use safe default
-        num_rounds = getattr(self.config, 'num_rounds', 5)
-        if num_rounds < 1:
-            num_rounds = 5
-            _LOGGER.warning("Invalid num_rounds, using default: 5")
+        # FIX #4: num_rounds is normalized once in _sync_config()
+        num_rounds = self._num_rounds
 
         _LOGGER.info(
             "Game started: %d players, round 1/%d",
@@ -8,112 +8,76 @@ from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
+_WWW_DIR = Path(__file__).parent.parent / "www"
+
 __all__: list[str] = ["register_static_paths", "StaticCSSView", "StaticJSView", "StaticVendorJSView"]
 
 
-class StaticCSSView(HomeAssistantView):
-    """View to serve CSS files with correct MIME type."""
+class _StaticFileView(HomeAssistantView):
+    """Base view serving files from one www/ subdirectory with a fixed MIME type."""
 
-    url = "/api/spyster/static/css/{filename}"
-    name = "api:spyster:static:css"
     requires_auth = False
 
+    # Set by subclasses
+    subdir: tuple[str, ...] = ()
+    content_type = "application/octet-stream"
+    label = "static"
+
     async def get(self, request: web.Request, filename: str) -> web.Response:
-        """Serve CSS file with correct Content-Type."""
+        """Serve static file with correct Content-Type."""
         try:
-            component_dir = Path(__file__).parent.parent
-            css_path = component_dir / "www" / "css" / filename
+            # Security: reject path traversal before touching the filesystem
+            if not filename or ".." in filename or "/" in filename or "\x00" in filename:
+                return web.Response(text="Forbidden", status=403)
 
-            if not css_path.exists():
-                _LOGGER.error("CSS file not found: %s", css_path)
-                return web.Response(text="Not found", status=404)
+            file_path = _WWW_DIR.joinpath(*self.subdir, filename)
 
-            # Security: prevent path traversal
-            if ".." in filename or filename.startswith("/"):
-                return web.Response(text="Forbidden", status=403)
+            if not file_path.exists():
+                _LOGGER.error("%s file not found: %s", self.label, file_path)
+                return web.Response(text="Not found", status=404)
 
-            content = css_path.read_text(encoding="utf-8")
+            content = file_path.read_text(encoding="utf-8")
             # Cache for 1 year - URL includes version query param for cache busting
             headers = {"Cache-Control": "public, max-age=31536000, immutable"}
             return web.Response(
                 text=content,
-                content_type="text/css",
+                content_type=self.content_type,
                 charset="utf-8",
                 headers=headers
             )
         except Exception as err:
-            _LOGGER.error("Error serving CSS %s: %s", filename, err)
+            _LOGGER.error("Error serving %s %s: %s", self.label, filename, err)
             return web.Response(text="Server error", status=500)
 
 
-class StaticJSView(HomeAssistantView):
-    """View to serve JavaScript files with correct MIME type."""
-
-    url = "/api/spyster/static/js/{filename}"
-    name = "api:spyster:static:js"
-    requires_auth = False
+class StaticCSSView(_StaticFileView):
+    """View to serve CSS files with correct MIME type."""
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
-        """Serve JavaScript file with correct Content-Type."""
-        try:
-            component_dir = Path(__file__).parent.parent
-            js_path = component_dir / "www" / "js" / filename
+    url = "/api/spyster/static/css/{filename}"
+    name = "api:spyster:static:css"
+    subdir = ("css",)
+    content_type = "text/css"
+    label = "CSS"
 
-            if not js_path.exists():
-                _LOGGER.error("JS file not found: %s", js_path)
-                return web.Response(text="Not found", status=404)
 
-            # Security: prevent path traversal
-            if ".." in filename or filename.startswith("/"):
-                return web.Response(text="Forbidden", status=403)
+class StaticJSView(_StaticFileView):
+    """View to serve JavaScript files with correct MIME type."""
 
-            content = js_path.read_text(encoding="utf-8")
-            # Cache for 1 year - URL includes version query param for cache busting
-            headers = {"Cache-Control": "public, max-age=31536000, immutable"}
-            return web.Response(
-                text=content,
-                content_type="application/javascript",
-                charset="utf-8",
-                headers=headers
-            )
-        except Exception as err:
-            _LOGGER.error("Error serving JS %s: %s", filename, err)
-            return web.Response(text="Server error", status=500)
+    url = "/api/spyster/static/js/{filename}"
+    name = "api:spyster:static:js"
+    subdir = ("js",)
+    content_type = "application/javascript"
+    label = "JS"
 
 
-class StaticVendorJSView(HomeAssistantView):
+class StaticVendorJSView(_StaticFileView):
     """View to serve vendor JavaScript files with correct MIME type."""
 
     url = "/api/spyster/static/js/vendor/{filename}"
     name = "api:spyster:static:js:vendor"
-    requires_auth = False
-
-    async def get(self, request: web.Request, filename: str) -> web.Response:
-        """Serve vendor JavaScript file with correct Content-Type."""
-        try:
-            component_dir = Path(__file__).parent.parent
-            js_path = component_dir / "www" / "js" / "vendor" / filename
-
-            if not js_path.exists():
-                _LOGGER.error("Vendor JS file not found: %s", js_path)
-                return web.Response(text="Not found", status=404)
-
-            # Security: prevent path traversal
-            if ".." in filename or filename.startswith("/"):
-                return web.Response(text="Forbidden", status=403)
-
-            content = js_path.read_text(encoding="utf-8")
-            # Cache for 1 year - URL includes version query param for cache busting
-            headers = {"Cache-Control": "public, max-age=31536000, immutable"}
-            return web.Response(
-                text=content,
-                content_type="application/javascript",
-                charset="utf-8",
-                headers=headers
-            )
-        except Exception as err:
-            _LOGGER.error("Error serving vendor JS %s: %s", filename, err)
-            return web.Response(text="Server error", status=500)
+    subdir = ("js", "vendor")
+    content_type = "application/javascript"
+    label = "Vendor JS"
 
 
 def register_static_paths(hass: HomeAssistant) -> None:
@@ -1,5 +1,6 @@
 """HTTP views for Spyster integration."""
 import base64
+import functools
 import io
 import json
 import logging
@@ -11,7 +12,7 @@ import qrcode
 from aiohttp import web
 from homeassistant.components.http import HomeAssistantView
 
-from ..const import ERR_INTERNAL, ERROR_MESSAGES
+from ..const import DEFAULT_QR_BORDER, DEFAULT_QR_BOX_SIZE, ERR_INTERNAL, ERROR_MESSAGES
 from .websocket import WebSocketHandler
 
 if TYPE_CHECKING:
@@ -19,6 +20,17 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Constant error bodies for SpysterQRView, serialized once at import
+_QR_ERR_NO_BASE_URL = json.dumps(
+    {"error": True, "code": ERR_INTERNAL, "message": "Server configuration error"}
+).encode("utf-8")
+_QR_ERR_NO_SESSION = json.dumps(
+    {"error": True, "code": ERR_INTERNAL, "message": "No active game session"}
+).encode("utf-8")
+_QR_ERR_INTERNAL = json.dumps(
+    {"error": True, "code": ERR_INTERNAL, "message": ERROR_MESSAGES[ERR_INTERNAL]}
+).encode("utf-8")
+
 # Cache the version to avoid reading manifest on every request
 _CACHED_VERSION: str | None = None
 
@@ -41,29 +53,60 @@ def _get_version() -> str:
     return _CACHED_VERSION
 
 
-def _inject_cache_bust(html_content: str) -> str:
+# Static file URLs (CSS, JS, vendor JS) followed by their closing quote
+# Matches: /api/spyster/static/css/styles.css, /api/spyster/static/js/host.js,
+# or /api/spyster/static/js/vendor/qrcode.min.js
+_CACHE_BUST_RE = re.compile(
+    rb'(/api/spyster/static/(?:css|js(?:/vendor)?)/[^"\']+\.(?:css|js))(["\'])'
+)
+
+
+def _inject_cache_bust(html_content: bytes) -> bytes:
     """Inject version query parameter into static file URLs for cache busting.
 
+    Works on raw bytes so the HTML is never decoded and re-encoded.
+
     Args:
-        html_content: The HTML content to process
+        html_content: The UTF-8 encoded HTML content to process
 
     Returns:
         HTML content with versioned static file URLs
     """
-    version = _get_version()
+    replacement = b"\\1?v=" + _get_version().encode("utf-8") + b"\\2"
+    return _CACHE_BUST_RE.sub(replacement, html_content)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_qr_data_url(url: str, box_size: int, border: int) -> str:
+    """Render a QR code for the given URL as a base64 PNG data URL.
 
-    # Pattern to match static file URLs (CSS, JS, vendor JS)
-    # Matches: /api/spyster/static/css/styles.css, /api/spyster/static/js/host.js,
-    # or /api/spyster/static/js/vendor/qrcode.min.js
-    pattern = r'(/api/spyster/static/(?:css|js(?:/vendor)?)/[^"\']+\.(css|js))(["\'])'
+    Pure function so results can be memoized: the join URL only changes
+    when the session does, so repeat requests are served from the cache.
 
-    def add_version(match: re.Match) -> str:
-        url = match.group(1)
-        quote = match.group(3)
-        # Add version query parameter
-        return f'{url}?v={version}{quote}'
+    Args:
+        url: The URL to encode in the QR code
+        box_size: Pixel size of each QR module
+        border: Quiet-zone width in modules
+
+    Returns:
+        Base64-encoded PNG data URL for the QR code image
+    """
+    qr = qrcode.QRCode(
+        version=1,  # Auto-adjust size
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=box_size,
+        border=border,
+    )
+    qr.add_data(url)
+    qr.make(fit=True)
+
+    # Generate PIL image and encode as PNG (fast compression - image is tiny)
+    img = qr.make_image(fill_color="black", back_color="white")
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", compress_level=1)
 
-    return re.sub(pattern, add_version, html_content)
+    _LOGGER.debug("QR code rendered: url=%s, size=%d bytes", url, buffer.tell())
+    return "data:image/png;base64," + base64.b64encode(buffer.getbuffer()).decode("ascii")
 
 
 class HostView(HomeAssistantView):
@@ -96,11 +139,10 @@ class HostView(HomeAssistantView):
                     content_type="text/plain",
                 )
 
-            # Read the HTML file and inject cache busting
-            html_content = html_path.read_text(encoding="utf-8")
-            html_content = _inject_cache_bust(html_content)
+            # Read the HTML file and inject cache busting (bytes end to end)
+            body = _inject_cache_bust(html_path.read_bytes())
 
-            return web.Response(text=html_content, content_type="text/html")
+            return web.Response(body=body, content_type="text/html", charset="utf-8")
         except FileNotFoundError as err:
             _LOGGER.error("host.html not found: %s", err)
             return web.Response(
@@ -147,11 +189,10 @@ class PlayerView(HomeAssistantView):
                     content_type="text/plain",
                 )
 
-            # Read the HTML file and inject cache busting
-            html_content = html_path.read_text(encoding="utf-8")
-            html_content = _inject_cache_bust(html_content)
+            # Read the HTML file and inject cache busting (bytes end to end)
+            body = _inject_cache_bust(html_path.read_bytes())
 
-            return web.Response(text=html_content, content_type="text/html")
+            return web.Response(body=body, content_type="text/html", charset="utf-8")
         except FileNotFoundError as err:
             _LOGGER.error("player.html not found: %s", err)
             return web.Response(
@@ -199,8 +240,6 @@ class SpysterQRView(HomeAssistantView):
         Raises:
             ValueError: If URL is empty or invalid
         """
-        from ..const import DEFAULT_QR_BOX_SIZE, DEFAULT_QR_BORDER
-
         if not url:
             raise ValueError("URL cannot be empty")
 
@@ -210,31 +249,7 @@ class SpysterQRView(HomeAssistantView):
             raise ValueError(f"URL too long (max {MAX_QR_URL_LENGTH} characters)")
 
         try:
-            # Create QR code instance
-            qr = qrcode.QRCode(
-                version=1,  # Auto-adjust size
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=DEFAULT_QR_BOX_SIZE,
-                border=DEFAULT_QR_BORDER,
-            )
-            qr.add_data(url)
-            qr.make(fit=True)
-
-            # Generate PIL image
-            img = qr.make_image(fill_color="black", back_color="white")
-
-            # Convert to PNG bytes
-            buffer = io.BytesIO()
-            img.save(buffer, format="PNG")
-            img_bytes = buffer.getvalue()
-
-            # Encode as base64 data URL
-            img_str = base64.b64encode(img_bytes).decode("utf-8")
-            data_url = f"data:image/png;base64,{img_str}"
-
-            _LOGGER.debug("QR code generated: url=%s, size=%d bytes", url, len(img_bytes))
-            return data_url
-
+            return _render_qr_data_url(url, DEFAULT_QR_BOX_SIZE, DEFAULT_QR_BORDER)
         except Exception as err:
             _LOGGER.error("QR code generation failed: %s", err, exc_info=True)
             raise
@@ -255,13 +270,10 @@ class SpysterQRView(HomeAssistantView):
 
             if not base_url:
                 _LOGGER.error("Home Assistant base_url not configured")
-                return web.json_response(
-                    {
-                        "error": True,
-                        "code": ERR_INTERNAL,
-                        "message": "Server configuration error",
-                    },
+                return web.Response(
+                    body=_QR_ERR_NO_BASE_URL,
                     status=500,
+                    content_type="application/json",
                 )
 
             # Get join URL from game state
@@ -269,13 +281,10 @@ class SpysterQRView(HomeAssistantView):
                 join_url = self.game_state.get_join_url(base_url)
             except ValueError as err:
                 _LOGGER.warning("Failed to get join URL: %s", err)
-                return web.json_response(
-                    {
-                        "error": True,
-                        "code": ERR_INTERNAL,
-                        "message": "No active game session",
-                    },
+                return web.Response(
+                    body=_QR_ERR_NO_SESSION,
                     status=400,
+                    content_type="application/json",
                 )
 
             # Generate QR code
@@ -283,13 +292,10 @@ class SpysterQRView(HomeAssistantView):
                 qr_data_url = self.generate_qr_code(join_url)
             except Exception as err:
                 _LOGGER.error("QR code generation failed: %s", err)
-                return web.json_response(
-                    {
-                        "error": True,
-                        "code": ERR_INTERNAL,
-                        "message": ERROR_MESSAGES[ERR_INTERNAL],
-                    },
+                return web.Response(
+                    body=_QR_ERR_INTERNAL,
                     status=500,
+                    content_type="application/json",
                 )
 
             _LOGGER.info("QR code requested: session=%s", self.game_state.session_id)
@@ -305,13 +311,10 @@ class SpysterQRView(HomeAssistantView):
 
         except Exception as err:
             _LOGGER.error("Unexpected error in QR view: %s", err, exc_info=True)
-            return web.json_response(
-                {
-                    "error": True,
-                    "code": ERR_INTERNAL,
-                    "message": ERROR_MESSAGES[ERR_INTERNAL],
-                },
+            return web.Response(
+                body=_QR_ERR_INTERNAL,
                 status=500,
+                content_type="application/json",
             )
 
 
@@ -1,28 +1,36 @@
 """WebSocket handler for real-time game communication."""
 import asyncio
-import json
 import logging
-from datetime import datetime
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict
 
-from aiohttp import WSMsgType, web
+import orjson
+from aiohttp import WSCloseCode, WSMsgType, web
 
 from ..const import (
+    BROADCAST_SEND_TIMEOUT,
     DISCONNECT_GRACE_SECONDS,
     ERR_CONNECTION_LIMIT,
     ERR_GAME_ALREADY_STARTED,
     ERR_GAME_FULL,
+    ERR_INVALID_LOCATION,
     ERR_INVALID_MESSAGE,
     ERR_MESSAGE_PARSE_FAILED,
     ERR_NAME_INVALID,
+    ERR_NOT_CONNECTED,
     ERR_NOT_HOST,
     ERR_NOT_IN_GAME,
+    ERR_NO_TARGET_SELECTED,
     ERROR_MESSAGES,
+    LOBBY_BROADCAST_DELAY,
     MAX_CONNECTIONS,
     MAX_NAME_LENGTH,
     MAX_PLAYERS,
     MIN_NAME_LENGTH,
+    OUTBOUND_QUEUE_SIZE,
+    TIMER_TICK_SLACK,
     WS_HEARTBEAT_TIMEOUT,
+    WS_MAX_MSG_SIZE,
+    WS_RECEIVE_TIMEOUT,
 )
 from ..game.player import PlayerSession
 from ..game.state import GamePhase
@@ -32,6 +40,97 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# SECURITY: Characters rejected in player names (XSS prevention).
+# Translating with this table deletes them; any change means the name had one.
+_NAME_XLATE = str.maketrans("", "", '<>"\'&;')
+
+_NAME_ERR_LENGTH = "Please enter a name (1-20 characters)"
+_NAME_ERR_CHARS = "Name contains invalid characters"
+
+
+def _validate_name(raw: Any) -> tuple[str, str | None]:
+    """Normalize and validate a player name from a client message.
+
+    Args:
+        raw: Name value as received
+
+    Returns:
+        Tuple of (stripped name, error message or None if valid)
+    """
+    if not isinstance(raw, str):
+        return "", _NAME_ERR_LENGTH
+
+    name = raw.strip()
+    if not MIN_NAME_LENGTH <= len(name) <= MAX_NAME_LENGTH:
+        return name, _NAME_ERR_LENGTH
+    if name.translate(_NAME_XLATE) != name:
+        return name, _NAME_ERR_CHARS
+    return name, None
+
+
+# Raw heartbeat frames as sent by player.js/host.js (JSON.stringify output),
+# plus the spaced form produced by Python's json.dumps
+_HEARTBEAT_FRAMES = frozenset({'{"type":"heartbeat"}', '{"type": "heartbeat"}'})
+
+# Serialize datetimes natively as UTC ISO-8601 ("Z") instead of converting
+# them to str in Python before every send
+_ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+async def _send(ws: web.WebSocketResponse, payload: dict[str, Any]) -> None:
+    """Serialize a message with orjson and send it to the client.
+
+    Sent as a TEXT frame: the browser clients JSON.parse(event.data),
+    which a binary frame (delivered as a Blob) would break.
+
+    Args:
+        ws: WebSocket connection
+        payload: JSON-serializable message
+    """
+    await ws.send_str(orjson.dumps(payload, option=_ORJSON_OPTS).decode("utf-8"))
+
+
+def _encode_state(state: dict[str, Any]) -> str:
+    """Serialize a get_state() payload as a "state" message frame."""
+    return orjson.dumps({"type": "state", **state}, option=_ORJSON_OPTS).decode("utf-8")
+
+
+def _encode_error(error_code: str, message: str) -> str:
+    """Serialize an "error" message frame."""
+    return orjson.dumps(
+        {"type": "error", "code": error_code, "message": message}
+    ).decode("utf-8")
+
+
+# Error frames are static - serialize each known code once at import
+_ERROR_FRAMES: dict[str, str] = {
+    code: _encode_error(code, message) for code, message in ERROR_MESSAGES.items()
+}
+
+_CONFIG_MISSING_FIELD_FRAME = _encode_error(
+    ERR_INVALID_MESSAGE, "Missing field or value in configure message."
+)
+
+_HOST_JOIN_ERR_NOT_HOST = "Only the host can use this feature"
+_HOST_JOIN_ERR_STARTED = "Game has already started"
+_HOST_JOIN_ERR_NAME_TAKEN = "That name is already taken"
+_HOST_JOIN_ERR_FULL = "Game is full"
+
+# Every host_join_response failure reason is a fixed string
+_HOST_JOIN_FAILURE_FRAMES: dict[str, str] = {
+    error: orjson.dumps(
+        {"type": "host_join_response", "success": False, "error": error}
+    ).decode("utf-8")
+    for error in (
+        _NAME_ERR_LENGTH,
+        _NAME_ERR_CHARS,
+        _HOST_JOIN_ERR_NOT_HOST,
+        _HOST_JOIN_ERR_STARTED,
+        _HOST_JOIN_ERR_NAME_TAKEN,
+        _HOST_JOIN_ERR_FULL,
+    )
+}
+
 
 class WebSocketHandler:
     """Handles WebSocket connections for real-time game communication."""
@@ -43,11 +142,46 @@ class WebSocketHandler:
             game_state: Reference to active GameState instance
         """
         self.game_state = game_state
-        self._connections: Dict[str, web.WebSocketResponse] = {}  # connection_id → ws
+        self._connections: Dict[int, web.WebSocketResponse] = {}  # connection_id → ws
         self._ws_to_player: Dict[web.WebSocketResponse, "PlayerSession"] = {}  # ws → PlayerSession
+        # Per-connection outbound queues drained by writer tasks (broadcasts)
+        self._out_queues: Dict[web.WebSocketResponse, asyncio.Queue] = {}
+        self._writer_tasks: Dict[web.WebSocketResponse, asyncio.Task] = {}
+        # Last state frame queued per connection, to skip unchanged resends
+        self._last_frames: Dict[web.WebSocketResponse, str] = {}
         self._connection_counter = 0
+        # Message type → handler(ws, message); heartbeat is routed separately
+        self._dispatch: Dict[str, Callable[[web.WebSocketResponse, dict], Awaitable[None]]] = {
+            "join": self._handle_join,  # Story 2.2
+            "admin": self._handle_admin,  # Story 2.6 (host-only)
+            "configure": self._handle_configure,  # Story 3.1 (host-only)
+            "call_vote": self._handle_call_vote,  # Story 4.5
+            "vote": self._handle_vote,  # Story 5.3
+            "spy_guess": self._handle_spy_guess,  # Story 5.4
+            "host_join_as_player": self._handle_host_join_as_player,
+        }
+        # Admin action → handler(ws, message), after host validation
+        self._admin_dispatch: Dict[str, Callable[[web.WebSocketResponse, dict], Awaitable[None]]] = {
+            "remove_player": self._handle_remove_player,  # Story 2.6
+            "start_game": lambda ws, data: self._handle_start_game(ws),
+            "advance_turn": lambda ws, data: self._handle_advance_turn(ws),  # Story 4.3
+            "skip_to_vote": lambda ws, data: self._handle_skip_to_vote(ws),  # Story 7.5
+            "next_round": lambda ws, data: self._handle_next_round(ws),
+            "pause": lambda ws, data: self._handle_pause(ws),
+            "end_game": lambda ws, data: self._handle_end_game(ws),
+        }
         # Story 4.2: Periodic timer broadcast task
         self._timer_broadcast_task: asyncio.Task | None = None
+        # (phase, whole seconds left) at the last broadcast; timer ticks that
+        # would repeat it are skipped
+        self._last_broadcast_key: tuple[GamePhase, int | None] | None = None
+        # Coalesces join/reconnect/disconnect bursts into a single broadcast
+        self._lobby_broadcast_pending: asyncio.TimerHandle | None = None
+        # Fire-and-forget tasks, referenced until done so they can't be
+        # garbage collected mid-flight and are cancelled on shutdown
+        self._background_tasks: set[asyncio.Task] = set()
+        # Collapses broadcasts requested within one event-loop iteration
+        self._broadcast_pending: asyncio.Handle | None = None
 
     async def handle_connection(self, request: web.Request) -> web.WebSocketResponse:
         """Handle new WebSocket connection with session management (Story 2.3).
@@ -58,22 +192,28 @@ class WebSocketHandler:
         Returns:
             WebSocketResponse object
         """
-        from ..const import ERR_INVALID_TOKEN, ERR_SESSION_EXPIRED
-
         # Check connection pool limit (ARCH-12)
         if len(self._connections) >= MAX_CONNECTIONS:
             _LOGGER.warning("Connection limit reached: %d/%d", len(self._connections), MAX_CONNECTIONS)
-            ws = web.WebSocketResponse(heartbeat=WS_HEARTBEAT_TIMEOUT)
+            # Rejected socket sends one error frame: skip deflate negotiation
+            ws = web.WebSocketResponse(heartbeat=WS_HEARTBEAT_TIMEOUT, compress=False)
             await ws.prepare(request)
-            await ws.send_json({
-                "type": "error",
-                "code": ERR_CONNECTION_LIMIT,
-                "message": ERROR_MESSAGES[ERR_CONNECTION_LIMIT]
-            })
+            await self._send_error(ws, ERR_CONNECTION_LIMIT)
             await ws.close(code=1008, message=b"Connection limit reached")
             return ws
 
-        ws = web.WebSocketResponse(heartbeat=WS_HEARTBEAT_TIMEOUT)
+        # Cap frame size and idle time so abusive clients fail fast instead of
+        # being buffered (clients heartbeat every 10s)
+        # permessage-deflate keeps its window across messages, so successive
+        # near-identical state snapshots compress down to little more than
+        # what changed. That history is per connection, which is why frames
+        # are compressed by each socket rather than once per broadcast.
+        ws = web.WebSocketResponse(
+            heartbeat=WS_HEARTBEAT_TIMEOUT,
+            max_msg_size=WS_MAX_MSG_SIZE,
+            receive_timeout=WS_RECEIVE_TIMEOUT,
+            compress=True,
+        )
         prepared = await ws.prepare(request)
 
         # Verify WebSocket was prepared successfully (ARCH-12)
@@ -83,7 +223,7 @@ class WebSocketHandler:
 
         # Generate unique connection ID
         self._connection_counter += 1
-        connection_id = f"conn_{self._connection_counter}"
+        connection_id = self._connection_counter
         self._connections[connection_id] = ws
 
         _LOGGER.info(
@@ -105,19 +245,16 @@ class WebSocketHandler:
 
                 # Send restored session state
                 # FIXED: Use correct attribute name
-                await ws.send_json({
+                await _send(ws, {
                     "type": "session_restored",
                     "name": session.name,
                     "token": session.session_token,
                     "is_host": session.is_host
                 })
 
-                # Send current game state
-                state = self.game_state.get_state(for_player=session.name)
-                await ws.send_json({"type": "state", **state})
-
-                # Broadcast to others that player reconnected
-                await self.broadcast_state()
+                # Broadcast delivers current state to this player and tells
+                # others that they reconnected
+                self._schedule_lobby_broadcast()
 
                 _LOGGER.info("Player reconnected: %s", session.name)
             else:
@@ -142,8 +279,10 @@ class WebSocketHandler:
                 del self._connections[connection_id]
 
             # Remove WebSocket to player mapping
-            if ws in self._ws_to_player:
-                del self._ws_to_player[ws]
+            self._ws_to_player.pop(ws, None)
+
+            # Stop the outbound writer for this connection
+            self._close_outbox(ws)
 
             # Story 2.4: Handle player disconnect after cleanup
             if player_session:
@@ -158,7 +297,7 @@ class WebSocketHandler:
         return ws
 
     async def _send_welcome(
-        self, ws: web.WebSocketResponse, connection_id: str
+        self, ws: web.WebSocketResponse, connection_id: int
     ) -> None:
         """Send welcome message to newly connected client.
 
@@ -166,17 +305,18 @@ class WebSocketHandler:
             ws: WebSocket connection
             connection_id: Unique connection identifier
         """
-        await ws.send_json(
+        await _send(
+            ws,
             {
                 "type": "welcome",
-                "connection_id": connection_id,
+                "connection_id": f"conn_{connection_id}",
                 "server_version": "1.0.0",
                 "game_active": self.game_state is not None,
             }
         )
 
     async def _message_loop(
-        self, ws: web.WebSocketResponse, connection_id: str
+        self, ws: web.WebSocketResponse, connection_id: int
     ) -> None:
         """Process incoming messages from WebSocket.
 
@@ -184,19 +324,28 @@ class WebSocketHandler:
             ws: WebSocket connection
             connection_id: Unique connection identifier
         """
-        async for msg in ws:
-            if msg.type == WSMsgType.TEXT:
-                await self._handle_text_message(ws, connection_id, msg.data)
-            elif msg.type == WSMsgType.ERROR:
-                _LOGGER.warning(
-                    "WebSocket error on %s: %s",
-                    connection_id,
-                    ws.exception(),
-                )
-            # BINARY and other types ignored for now
+        try:
+            async for msg in ws:
+                msg_type = msg.type
+                if msg_type is WSMsgType.TEXT:
+                    await self._handle_text_message(ws, connection_id, msg.data)
+                elif msg_type is WSMsgType.BINARY:
+                    # Protocol is JSON text only - drop binary frames
+                    continue
+                elif msg_type is WSMsgType.ERROR:
+                    _LOGGER.warning(
+                        "WebSocket error on %s: %s",
+                        connection_id,
+                        ws.exception(),
+                    )
+        except asyncio.TimeoutError:
+            _LOGGER.info(
+                "WebSocket %s idle for %ds, closing", connection_id, WS_RECEIVE_TIMEOUT
+            )
+            await ws.close()
 
     async def _handle_text_message(
-        self, ws: web.WebSocketResponse, connection_id: str, data: str
+        self, ws: web.WebSocketResponse, connection_id: int, data: str
     ) -> None:
         """Handle text message from client.
 
@@ -205,9 +354,15 @@ class WebSocketHandler:
             connection_id: Unique connection identifier
             data: Raw message data
         """
+        # Story 2.4: Heartbeats are the most frequent frame and have a fixed
+        # shape - match the exact client encoding before any JSON parsing
+        if data in _HEARTBEAT_FRAMES:
+            await self._handle_heartbeat(connection_id, ws)
+            return
+
         try:
-            message = json.loads(data)
-        except json.JSONDecodeError as err:
+            message = orjson.loads(data)
+        except orjson.JSONDecodeError as err:
             _LOGGER.warning(
                 "Failed to parse JSON from %s: %s",
                 connection_id,
@@ -216,8 +371,8 @@ class WebSocketHandler:
             await self._send_error(ws, ERR_MESSAGE_PARSE_FAILED)
             return
 
-        # Validate message structure
-        if not isinstance(message, dict) or "type" not in message:
+        # Validate message structure (type must be a string to route on)
+        if not isinstance(message, dict) or not isinstance(message.get("type"), str):
             _LOGGER.warning(
                 "Invalid message structure from %s: %s",
                 connection_id,
@@ -234,66 +389,39 @@ class WebSocketHandler:
             message_type,
         )
 
-        # Story 2.4: Handle heartbeat messages
+        # Story 2.4: Handle heartbeat messages (most frequent; needs connection_id)
         if message_type == "heartbeat":
             await self._handle_heartbeat(connection_id, ws)
             return
 
-        # Story 2.2: Handle player join
-        if message_type == "join":
-            await self._handle_join(ws, message)
-            return
-
-        # Story 2.6: Handle admin actions (host-only)
-        if message_type == "admin":
-            await self._handle_admin(ws, message)
-            return
-
-        # Story 3.1: Handle configuration updates (host-only)
-        if message_type == "configure":
-            await self._handle_configure(ws, message)
-            return
-
-        # Story 4.5: Handle call vote from any player
-        if message_type == "call_vote":
-            await self._handle_call_vote(ws, message)
-            return
-
-        # Story 5.3: Handle vote submission
-        if message_type == "vote":
-            await self._handle_vote(ws, message)
-            return
-
-        # Story 5.4: Handle spy location guess
-        if message_type == "spy_guess":
-            await self._handle_spy_guess(ws, message)
-            return
-
-        # Host join as player (allows host to participate in the game)
-        if message_type == "host_join_as_player":
-            await self._handle_host_join_as_player(ws, message)
+        handler = self._dispatch.get(message_type)
+        if handler is not None:
+            await handler(ws, message)
             return
 
         # TODO: Route to other specific handlers based on message_type
         # For now, just acknowledge receipt
-        await ws.send_json({"type": "ack", "received": message_type})
+        await _send(ws, {"type": "ack", "received": message_type})
 
-    async def _send_error(self, ws: web.WebSocketResponse, error_code: str) -> None:
+    async def _send_error(
+        self,
+        ws: web.WebSocketResponse,
+        error_code: str,
+        fallback: str = "Unknown error",
+    ) -> None:
         """Send error message to client.
 
         Args:
             ws: WebSocket connection
             error_code: Error code constant
+            fallback: Message used if error_code has no ERROR_MESSAGES entry
         """
-        await ws.send_json(
-            {
-                "type": "error",
-                "code": error_code,
-                "message": ERROR_MESSAGES.get(error_code, "Unknown error"),
-            }
-        )
+        frame = _ERROR_FRAMES.get(error_code)
+        if frame is None:
+            frame = _encode_error(error_code, fallback)
+        await ws.send_str(frame)
 
-    async def _handle_heartbeat(self, connection_id: str, ws: web.WebSocketResponse) -> None:
+    async def _handle_heartbeat(self, connection_id: int, ws: web.WebSocketResponse) -> None:
         """Handle heartbeat message from client (Story 2.4).
 
         Updates player's last heartbeat timestamp and cancels disconnect timer if active.
@@ -310,10 +438,10 @@ class WebSocketHandler:
             return
 
         # Update last heartbeat timestamp
-        player_session.last_heartbeat = datetime.now()
+        player_session.update_heartbeat()
 
         # Cancel existing disconnect timer if reconnecting (ARCH-9)
-        timer_name = f"disconnect_grace:{player_session.name}"
+        timer_name = player_session.disconnect_timer_name
         if player_session.disconnect_timer and not player_session.disconnect_timer.done():
             player_session.disconnect_timer.cancel()
             player_session.disconnect_timer = None
@@ -326,7 +454,7 @@ class WebSocketHandler:
             player_session.ws = ws
             self._ws_to_player[ws] = player_session
             _LOGGER.info("Player reconnected via heartbeat: %s", player_session.name)
-            await self.broadcast_state()
+            self._schedule_lobby_broadcast()
 
     async def _on_disconnect(self, player_session) -> None:
         """Handle WebSocket close event - start disconnect grace timer (Story 2.4).
@@ -337,10 +465,21 @@ class WebSocketHandler:
         if not player_session:
             return
 
+        # Only registered players need a grace timer. The host display and
+        # sessions replaced by a newer join, or already restored onto another
+        # live socket, would just spawn a task whose expiry does nothing
+        if self.game_state.players.get(player_session.name) is not player_session:
+            return
+        if (
+            player_session.ws is not None
+            and self._ws_to_player.get(player_session.ws) is player_session
+        ):
+            return
+
         _LOGGER.info("WebSocket closed for player: %s, starting grace timer", player_session.name)
 
         # ARCH-9 FIX: Use GameState.start_timer() for consistent timer management
-        timer_name = f"disconnect_grace:{player_session.name}"
+        timer_name = player_session.disconnect_timer_name
 
         # Create timer callback that calls _disconnect_grace_completion
         async def timer_callback(name: str) -> None:
@@ -373,7 +512,76 @@ class WebSocketHandler:
         player_session.disconnect_timer = None
 
         # Broadcast updated state to all clients (NFR11 requirement)
-        await self.broadcast_state()
+        self._schedule_lobby_broadcast()
+
+    def _schedule_lobby_broadcast(self) -> None:
+        """Schedule a coalesced state broadcast after connection churn.
+
+        Joins, reconnects and disconnects often arrive in bursts (QR-scan
+        flurry, mobile network recovery). Rather than broadcasting once per
+        event, the first event arms a short timer and every event inside the
+        window shares the single broadcast it triggers.
+        """
+        if self._lobby_broadcast_pending is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._lobby_broadcast_pending = loop.call_later(
+            LOBBY_BROADCAST_DELAY, self._flush_lobby_broadcast
+        )
+
+    def _flush_lobby_broadcast(self) -> None:
+        """Send the coalesced broadcast scheduled by _schedule_lobby_broadcast."""
+        self._lobby_broadcast_pending = None
+        self._spawn_broadcast()
+
+    def _spawn_broadcast(self) -> None:
+        """Start a state broadcast as a tracked background task."""
+        self._spawn_background(self.broadcast_state(), "spyster_broadcast")
+
+    def _spawn_background(self, coro: Awaitable[Any], name: str) -> asyncio.Task:
+        """Run a coroutine as a background task the handler keeps track of.
+
+        Args:
+            coro: Coroutine to run
+            name: Task name, used when logging a failure
+
+        Returns:
+            The created task
+        """
+        task = asyncio.create_task(coro, name=name)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+        return task
+
+    def _on_background_task_done(self, task: asyncio.Task) -> None:
+        """Forget a finished background task and log it if it failed."""
+        self._background_tasks.discard(task)
+        if task.cancelled():
+            return
+        err = task.exception()
+        if err is not None:
+            _LOGGER.error(
+                "Background task %s failed: %s", task.get_name(), err, exc_info=err
+            )
+
+    def _schedule_broadcast(self) -> None:
+        """Schedule a state broadcast for the next event-loop iteration.
+
+        Game actions request a broadcast once their state change is done.
+        Requests made before the loop comes around again (e.g. a vote and
+        the reveal it triggers) share a single broadcast.
+        """
+        if self._broadcast_pending is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._broadcast_pending = loop.call_soon(self._flush_broadcast)
+
+    def _flush_broadcast(self) -> None:
+        """Send the broadcast scheduled by _schedule_broadcast."""
+        self._broadcast_pending = None
+        self._spawn_broadcast()
 
     async def _handle_join(self, ws: web.WebSocketResponse, data: dict) -> None:
         """Handle player join request (Story 2.2 + 2.3).
@@ -385,18 +593,11 @@ class WebSocketHandler:
             ws: WebSocket connection
             data: Join message data containing 'name' and optional 'is_host' fields
         """
-        name = data.get("name", "").strip()
         is_host = data.get("is_host", False)
 
-        # Validate name length
-        if not name or len(name) < MIN_NAME_LENGTH or len(name) > MAX_NAME_LENGTH:
-            await self._send_error(ws, ERR_NAME_INVALID)
-            return
-
-        # SECURITY FIX: Sanitize name to prevent XSS attacks
-        # Reject names containing HTML/script tags or special characters
-        import re as regex_module
-        if regex_module.search(r'[<>"\'&;]', name):
+        # Validate name length and reject HTML/script characters (XSS)
+        name, name_error = _validate_name(data.get("name", ""))
+        if name_error:
             await self._send_error(ws, ERR_NAME_INVALID)
             return
 
@@ -406,7 +607,10 @@ class WebSocketHandler:
             return
 
         # Check game capacity (before adding player)
-        if len(self.game_state.players) >= MAX_PLAYERS and name not in self.game_state.players:
+        if (
+            self.game_state.real_player_count >= MAX_PLAYERS
+            and name not in self.game_state.players
+        ):
             await self._send_error(ws, ERR_GAME_FULL)
             return
 
@@ -436,20 +640,16 @@ class WebSocketHandler:
                 _LOGGER.info("Host display connected (not added as player)")
 
             # FIXED: Use correct message type "join_success" and field names per spec
-            await ws.send_json({
+            await _send(ws, {
                 "type": "join_success",
                 "player_name": session.name,
                 "session_token": session.session_token,
                 "is_host": session.is_host
             })
 
-            # Send initial state
-            state = self.game_state.get_state(for_player=session.name)
-            await ws.send_json({"type": "state", **state})
-
-            # Broadcast to all players (only if an actual player joined)
-            if not is_host_display:
-                await self.broadcast_state()
+            # Broadcast delivers initial state to the joiner (player or host
+            # display) along with everyone else
+            self._schedule_lobby_broadcast()
 
             _LOGGER.info(
                 "Player joined: %s (total: %d)",
@@ -468,64 +668,31 @@ class WebSocketHandler:
             ws: WebSocket connection (must be the host)
             data: Message data containing 'name' field
         """
-        import re as regex_module
-
         # Verify this is the host connection
         player_session = self._ws_to_player.get(ws)
         if not player_session or not player_session.is_host:
-            await ws.send_json({
-                "type": "host_join_response",
-                "success": False,
-                "error": "Only the host can use this feature"
-            })
+            await ws.send_str(_HOST_JOIN_FAILURE_FRAMES[_HOST_JOIN_ERR_NOT_HOST])
             return
 
-        name = data.get("name", "").strip()
-
-        # Validate name length
-        if not name or len(name) < MIN_NAME_LENGTH or len(name) > MAX_NAME_LENGTH:
-            await ws.send_json({
-                "type": "host_join_response",
-                "success": False,
-                "error": "Please enter a name (1-20 characters)"
-            })
-            return
-
-        # SECURITY: Sanitize name to prevent XSS
-        if regex_module.search(r'[<>"\'&;]', name):
-            await ws.send_json({
-                "type": "host_join_response",
-                "success": False,
-                "error": "Name contains invalid characters"
-            })
+        # Validate name length and reject HTML/script characters (XSS)
+        name, name_error = _validate_name(data.get("name", ""))
+        if name_error:
+            await ws.send_str(_HOST_JOIN_FAILURE_FRAMES[name_error])
             return
 
         # Check game phase - must be in LOBBY
         if self.game_state.phase != GamePhase.LOBBY:
-            await ws.send_json({
-                "type": "host_join_response",
-                "success": False,
-                "error": "Game has already started"
-            })
+            await ws.send_str(_HOST_JOIN_FAILURE_FRAMES[_HOST_JOIN_ERR_STARTED])
             return
 
         # Check if name is already taken (by someone other than HostDisplay)
         if name in self.game_state.players and name != "HostDisplay":
-            await ws.send_json({
-                "type": "host_join_response",
-                "success": False,
-                "error": "That name is already taken"
-            })
+            await ws.send_str(_HOST_JOIN_FAILURE_FRAMES[_HOST_JOIN_ERR_NAME_TAKEN])
             return
 
         # Check game capacity
-        current_player_count = sum(1 for p in self.game_state.players.values() if p.name != "HostDisplay")
-        if current_player_count >= MAX_PLAYERS:
-            await ws.send_json({
-                "type": "host_join_response",
-                "success": False,
-                "error": "Game is full"
-            })
+        if self.game_state.real_player_count >= MAX_PLAYERS:
+            await ws.send_str(_HOST_JOIN_FAILURE_FRAMES[_HOST_JOIN_ERR_FULL])
             return
 
         # Update the host's name from "HostDisplay" to the chosen name
@@ -546,57 +713,152 @@ class WebSocketHandler:
         _LOGGER.info("Host joined as player: %s", name)
 
         # Send success response
-        await ws.send_json({
+        await _send(ws, {
             "type": "host_join_response",
             "success": True,
             "player_name": name
         })
 
         # Broadcast updated state to all players
-        await self.broadcast_state()
+        self._schedule_broadcast()
+
+    def _queue_frame(
+        self, ws: web.WebSocketResponse, frame: str, label: str
+    ) -> bool:
+        """Queue a frame on a connection's outbound queue.
+
+        The connection's writer task is started on first use. A frame equal
+        to the last one queued for the connection is skipped, since the
+        client already has (or is about to get) that exact state. A client
+        whose queue is full cannot keep up and is disconnected; it can
+        restore its session with its token.
+
+        Args:
+            ws: Target WebSocket connection
+            frame: Serialized message
+            label: Player name (or "HostDisplay") for logging
+
+        Returns:
+            True if the frame was queued or the client already has it
+        """
+        if self._last_frames.get(ws) == frame:
+            return True
+
+        queue = self._out_queues.get(ws)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+            self._out_queues[ws] = queue
+            self._writer_tasks[ws] = asyncio.create_task(
+                self._writer_loop(ws, queue, label)
+            )
+
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            _LOGGER.warning("Outbound queue full for %s, disconnecting slow client", label)
+            self._close_outbox(ws)
+            self._spawn_background(
+                ws.close(code=WSCloseCode.TRY_AGAIN_LATER, message=b"Client too slow"),
+                f"spyster_close_slow_client:{label}",
+            )
+            return False
+        self._last_frames[ws] = frame
+        return True
+
+    async def _writer_loop(
+        self, ws: web.WebSocketResponse, queue: asyncio.Queue, label: str
+    ) -> None:
+        """Drain a connection's outbound queue to the socket.
+
+        Args:
+            ws: WebSocket connection to write to
+            queue: Outbound frame queue for this connection
+            label: Player name (or "HostDisplay") for logging
+        """
+        while True:
+            frame = await queue.get()
+            # Queued frames are full state snapshots: when several piled up
+            # during the last send, only the newest one is worth sending
+            while not queue.empty():
+                frame = queue.get_nowait()
+            # Public send_str only: aiohttp has no stable API for writing a
+            # pre-encoded TEXT frame (WebSocketWriter changed across 3.x),
+            # and the UTF-8 encode is cheap next to building the state.
+            # asyncio.timeout runs the send in this task; wait_for would wrap
+            # it in another one and can swallow the cancel from _close_outbox
+            # when that inner send has just finished
+            try:
+                async with asyncio.timeout(BROADCAST_SEND_TIMEOUT):
+                    await ws.send_str(frame)
+            except Exception as err:
+                _LOGGER.warning("Failed to send state to %s: %s", label, err)
+                self._close_outbox(ws)
+                if not ws.closed:
+                    await ws.close(
+                        code=WSCloseCode.TRY_AGAIN_LATER, message=b"Send failed"
+                    )
+                return
+
+    def _close_outbox(self, ws: web.WebSocketResponse) -> None:
+        """Drop a connection's outbound queue and stop its writer task."""
+        self._out_queues.pop(ws, None)
+        self._last_frames.pop(ws, None)
+        task = self._writer_tasks.pop(ws, None)
+        if task and task is not asyncio.current_task():
+            task.cancel()
 
     async def broadcast_state(self) -> None:
         """Broadcast personalized state to all players (Story 3.4).
 
         CRITICAL: Each player receives a personalized payload.
-        NEVER broadcast the same state to all players (security violation).
+        NEVER broadcast the same state to all players (security violation)
+        unless GameState.is_state_shared() confirms it has no private fields.
 
-        SECURITY: Cross-validates WebSocket ownership before sending.
+        SECURITY: Sends only on the socket each player's session owns.
+
+        Frames are handed to each connection's outbound queue, so a slow
+        client never delays the others. In phases without personalized
+        fields the state is serialized only once.
         """
         failed_broadcasts = []
+        self._last_broadcast_key = self._timer_broadcast_key()
 
-        # Each player gets personalized state (Story 3.4)
-        for player_name, player in self.game_state.players.items():
-            if player.ws and not player.ws.closed:
-                # SECURITY FIX: Validate WebSocket actually belongs to this player
-                mapped_player = self._ws_to_player.get(player.ws)
-                if mapped_player and mapped_player.name != player_name:
-                    _LOGGER.error(
-                        "WebSocket ownership mismatch: expected %s, got %s",
-                        player_name,
-                        mapped_player.name
-                    )
-                    failed_broadcasts.append(player_name)
-                    continue
-
-                try:
-                    # Per-player filtering happens here (Story 3.4)
-                    state = self.game_state.get_state(for_player=player_name)
-                    await player.ws.send_json({"type": "state", **state})
-                except Exception as err:
-                    _LOGGER.warning("Failed to send state to %s: %s", player_name, err)
-                    failed_broadcasts.append(player_name)
+        shared_frame = None
+        if self.game_state.is_state_shared():
+            shared_frame = _encode_state(self.game_state.get_state(for_player=None))
 
-        # Also send to host display connections (not in players list)
+        # _ws_to_player holds exactly the live connections (entries are added
+        # on join/restore/heartbeat reconnect and dropped on close), so
+        # disconnected players are never visited. Nothing below awaits or
+        # mutates the mapping, so it is iterated in place without a copy.
         for ws, session in self._ws_to_player.items():
             if session.name == "HostDisplay" and session.is_host:
-                if ws and not ws.closed:
-                    try:
-                        # Host display gets full state (host view)
-                        state = self.game_state.get_state(for_player=None)
-                        await ws.send_json({"type": "state", **state})
-                    except Exception as err:
-                        _LOGGER.warning("Failed to send state to HostDisplay: %s", err)
+                # Host display gets full state (host view)
+                frame = shared_frame or _encode_state(
+                    self.game_state.get_state(for_player=None)
+                )
+                self._queue_frame(ws, frame, "HostDisplay")
+                continue
+
+            player_name = session.name
+            # SECURITY: Only current players receive state, and only on the
+            # socket their session owns (a replaced session's old socket is
+            # still mapped until it closes)
+            if self.game_state.players.get(player_name) is not session or session.ws is not ws:
+                continue
+
+            try:
+                # Per-player filtering happens here (Story 3.4)
+                frame = shared_frame or _encode_state(
+                    self.game_state.get_state(for_player=player_name)
+                )
+            except Exception as err:
+                _LOGGER.warning("Failed to build state for %s: %s", player_name, err)
+                failed_broadcasts.append(player_name)
+                continue
+
+            if not self._queue_frame(ws, frame, player_name):
+                failed_broadcasts.append(player_name)
 
         # Log aggregate broadcast failures for monitoring
         if failed_broadcasts:
@@ -607,6 +869,7 @@ class WebSocketHandler:
 
         Broadcasts game state every 1 second during QUESTIONING and VOTE phases
         to ensure all clients see synchronized timer countdown (±1 second accuracy).
+        Outside those phases the loop waits on GameState instead of polling.
         """
         if self._timer_broadcast_task and not self._timer_broadcast_task.done():
             # Already running
@@ -616,10 +879,22 @@ class WebSocketHandler:
             """Background task that broadcasts state every second during timed phases."""
             try:
                 while True:
-                    await asyncio.sleep(1.0)  # Broadcast every 1 second (NFR5)
-
-                    # Only broadcast if in a timed phase
-                    if self.game_state.phase in [GamePhase.QUESTIONING, GamePhase.VOTE]:
+                    # Idle outside timed phases until GameState signals one
+                    if not self.game_state.in_timed_phase:
+                        await self.game_state.wait_for_timed_phase()
+
+                    # Wake just after the displayed second changes so every
+                    # client ticks together (NFR5); at most 1 second apart
+                    remaining = self.game_state.get_active_timer_remaining()
+                    delay = 1.0 if remaining is None else (remaining % 1.0) or 1.0
+                    await asyncio.sleep(min(1.0, delay + TIMER_TICK_SLACK))
+
+                    # Only broadcast in a timed phase, and only if the tick
+                    # changes what clients last received
+                    if (
+                        self.game_state.in_timed_phase
+                        and self._timer_broadcast_key() != self._last_broadcast_key
+                    ):
                         await self.broadcast_state()
             except asyncio.CancelledError:
                 _LOGGER.debug("Timer broadcast task cancelled")
@@ -630,6 +905,11 @@ class WebSocketHandler:
         self._timer_broadcast_task = asyncio.create_task(broadcast_loop())
         _LOGGER.info("Timer broadcasts started")
 
+    def _timer_broadcast_key(self) -> tuple[GamePhase, int | None]:
+        """Return the (phase, whole seconds left) pair clients currently see."""
+        remaining = self.game_state.get_active_timer_remaining()
+        return self.game_state.phase, None if remaining is None else int(remaining)
+
     async def stop_timer_broadcasts(self) -> None:
         """Stop periodic timer broadcasts (Story 4.2)."""
         if self._timer_broadcast_task and not self._timer_broadcast_task.done():
@@ -641,6 +921,26 @@ class WebSocketHandler:
             self._timer_broadcast_task = None
             _LOGGER.info("Timer broadcasts stopped")
 
+    async def shutdown(self) -> None:
+        """Stop all background work on integration unload.
+
+        Stops the timer loop, drops any scheduled broadcast so nothing fires
+        after unload, and cancels in-flight background tasks.
+        """
+        await self.stop_timer_broadcasts()
+
+        if self._lobby_broadcast_pending is not None:
+            self._lobby_broadcast_pending.cancel()
+            self._lobby_broadcast_pending = None
+        if self._broadcast_pending is not None:
+            self._broadcast_pending.cancel()
+            self._broadcast_pending = None
+
+        tasks = list(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     def _get_player_by_ws(self, ws: web.WebSocketResponse) -> 'PlayerSession | None':
         """Get player session by WebSocket connection (Story 2.6).
 
@@ -682,23 +982,12 @@ class WebSocketHandler:
 
         action = data.get('action')
 
-        if action == 'remove_player':
-            await self._handle_remove_player(ws, data)
-        elif action == 'start_game':
-            await self._handle_start_game(ws)
-        elif action == 'advance_turn':
-            await self._handle_advance_turn(ws)
-        elif action == 'skip_to_vote':
-            await self._handle_skip_to_vote(ws)
-        elif action == 'next_round':
-            await self._handle_next_round(ws)
-        elif action == 'pause':
-            await self._handle_pause(ws)
-        elif action == 'end_game':
-            await self._handle_end_game(ws)
-        else:
+        handler = self._admin_dispatch.get(action)
+        if handler is None:
             _LOGGER.warning("Unknown admin action: %s", action)
             await self._send_error(ws, ERR_INVALID_MESSAGE)
+            return
+        await handler(ws, data)
 
     async def _handle_remove_player(self, ws: web.WebSocketResponse, data: dict) -> None:
         """Handle player removal admin action (Story 2.6).
@@ -724,7 +1013,7 @@ class WebSocketHandler:
             return
 
         _LOGGER.info('Admin removed player: %s by %s', target_player, player.name)
-        await self.broadcast_state()
+        self._schedule_broadcast()
 
     async def _handle_start_game(self, ws: web.WebSocketResponse) -> None:
         """Handle game start request from host (Story 3.2 + 4.2).
@@ -744,7 +1033,7 @@ class WebSocketHandler:
 
         # Game started successfully - broadcast to all players
         _LOGGER.info("Game started - transitioning to ROLES phase")
-        await self.broadcast_state()
+        self._schedule_broadcast()
 
     async def _handle_advance_turn(self, ws: web.WebSocketResponse) -> None:
         """Handle turn advancement request from host (Story 4.3: AC5).
@@ -755,7 +1044,7 @@ class WebSocketHandler:
         self.game_state.advance_turn()
 
         _LOGGER.info("Turn advanced by host")
-        await self.broadcast_state()
+        self._schedule_broadcast()
 
     async def _handle_skip_to_vote(self, ws: web.WebSocketResponse) -> None:
         """Handle skip to vote admin action (Story 7.5).
@@ -774,7 +1063,7 @@ class WebSocketHandler:
             return
 
         _LOGGER.info("Host skipped to voting phase")
-        await self.broadcast_state()
+        self._schedule_broadcast()
 
     async def _handle_next_round(self, ws: web.WebSocketResponse) -> None:
         """Handle next round admin action (Story 7.5).
@@ -790,7 +1079,7 @@ class WebSocketHandler:
             return
 
         _LOGGER.info("Host started next round")
-        await self.broadcast_state()
+        self._schedule_broadcast()
 
     async def _handle_pause(self, ws: web.WebSocketResponse) -> None:
         """Handle pause/resume admin action (Story 7.5).
@@ -804,7 +1093,7 @@ class WebSocketHandler:
         self.game_state.paused = not getattr(self.game_state, 'paused', False)
 
         _LOGGER.info("Game %s by host", "paused" if self.game_state.paused else "resumed")
-        await self.broadcast_state()
+        self._schedule_broadcast()
 
     async def _handle_end_game(self, ws: web.WebSocketResponse) -> None:
         """Handle end game admin action (Story 7.5).
@@ -820,7 +1109,7 @@ class WebSocketHandler:
             return
 
         _LOGGER.info("Game ended by host")
-        await self.broadcast_state()
+        self._schedule_broadcast()
 
     async def _handle_configure(self, ws: web.WebSocketResponse, data: dict) -> None:
         """
@@ -847,28 +1136,20 @@ class WebSocketHandler:
         value = data.get("value")
 
         if not field or value is None:
-            await ws.send_json({
-                "type": "error",
-                "code": ERR_INVALID_MESSAGE,
-                "message": "Missing field or value in configure message."
-            })
+            await ws.send_str(_CONFIG_MISSING_FIELD_FRAME)
             return
 
         # Update configuration
         success, error = self.game_state.update_config(field, value)
 
         if not success:
-            await ws.send_json({
-                "type": "error",
-                "code": error,
-                "message": ERROR_MESSAGES.get(error, "Configuration update failed.")
-            })
+            await self._send_error(ws, error, fallback="Configuration update failed.")
             return
 
         _LOGGER.info("Configuration updated by host %s: %s = %s", player.name, field, value)
 
         # Broadcast updated state to all players
-        await self.broadcast_state()
+        self._schedule_broadcast()
 
     async def _handle_call_vote(self, ws: web.WebSocketResponse, data: dict) -> None:
         """
@@ -880,15 +1161,9 @@ class WebSocketHandler:
             ws: Player's WebSocket connection
             data: Message payload (empty for call_vote)
         """
-        from ..const import ERR_NOT_CONNECTED, ERROR_MESSAGES
-
         # Verify player is connected
         if ws not in self._ws_to_player:
-            await ws.send_json({
-                "type": "error",
-                "code": ERR_NOT_CONNECTED,
-                "message": ERROR_MESSAGES[ERR_NOT_CONNECTED]
-            })
+            await self._send_error(ws, ERR_NOT_CONNECTED)
             return
 
         player = self._ws_to_player[ws]
@@ -899,15 +1174,11 @@ class WebSocketHandler:
         success, error_code = self.game_state.call_vote(caller_name=player.name)
 
         if not success:
-            await ws.send_json({
-                "type": "error",
-                "code": error_code,
-                "message": ERROR_MESSAGES.get(error_code, "Unknown error")
-            })
+            await self._send_error(ws, error_code)
             return
 
         # Broadcast updated state to all clients (ARCH-14)
-        await self.broadcast_state()
+        self._schedule_broadcast()
 
     async def _handle_vote(self, ws: web.WebSocketResponse, data: dict) -> None:
         """Handle vote submission (Story 5.3).
@@ -916,20 +1187,9 @@ class WebSocketHandler:
             ws: Player's WebSocket connection
             data: Message payload {target, confidence}
         """
-        from ..const import (
-            ERR_NOT_IN_GAME,
-            ERR_NO_TARGET_SELECTED,
-            ERROR_MESSAGES,
-        )
-        from ..game.state import GamePhase
-
         # Verify player is in game
         if ws not in self._ws_to_player:
-            await ws.send_json({
-                "type": "error",
-                "code": ERR_NOT_IN_GAME,
-                "message": ERROR_MESSAGES[ERR_NOT_IN_GAME]
-            })
+            await self._send_error(ws, ERR_NOT_IN_GAME)
             return
 
         player = self._ws_to_player[ws]
@@ -940,45 +1200,29 @@ class WebSocketHandler:
 
         # Validate target provided
         if not target:
-            await ws.send_json({
-                "type": "error",
-                "code": ERR_NO_TARGET_SELECTED,
-                "message": ERROR_MESSAGES[ERR_NO_TARGET_SELECTED]
-            })
+            await self._send_error(ws, ERR_NO_TARGET_SELECTED)
             return
 
         # Record vote
         success, error_code = self.game_state.record_vote(player.name, target, confidence)
 
         if not success:
-            await ws.send_json({
-                "type": "error",
-                "code": error_code,
-                "message": ERROR_MESSAGES.get(error_code, "Could not record vote.")
-            })
+            await self._send_error(ws, error_code, fallback="Could not record vote.")
             return
 
         _LOGGER.info("Vote submitted: %s -> %s (confidence: %d)", player.name, target, confidence)
 
-        # Broadcast updated state (includes vote count)
-        await self.broadcast_state()
-
-        # Check if all votes submitted - trigger reveal
-        if self.game_state._all_votes_submitted():
-            await self._trigger_reveal()
-
-    async def _trigger_reveal(self) -> None:
-        """Trigger transition to REVEAL phase (Story 5.3)."""
-        from ..game.state import GamePhase
-
-        if self.game_state.phase != GamePhase.VOTE:
-            return
+        # The final vote moves straight to REVEAL (Story 5.3) before the
+        # broadcast, so one frame carries both the vote count and the phase
+        if (
+            self.game_state.phase == GamePhase.VOTE
+            and self.game_state._all_votes_submitted()
+        ):
+            _LOGGER.info("Transitioning to REVEAL phase (all votes in)")
+            self.game_state.phase = GamePhase.REVEAL
 
-        _LOGGER.info("Transitioning to REVEAL phase (all votes in)")
-        self.game_state.phase = GamePhase.REVEAL
-
-        # Broadcast the phase change
-        await self.broadcast_state()
+        # Broadcast updated state (includes vote count)
+        self._schedule_broadcast()
 
     async def _handle_spy_guess(self, ws: web.WebSocketResponse, data: dict) -> None:
         """Handle spy location guess (Story 5.4).
@@ -987,42 +1231,23 @@ class WebSocketHandler:
             ws: Player's WebSocket connection
             data: Message payload {location_id}
         """
-        from ..const import (
-            ERR_NOT_IN_GAME,
-            ERR_INVALID_LOCATION,
-            ERROR_MESSAGES,
-        )
-        from ..game.state import GamePhase
-
         # Verify player is in game
         if ws not in self._ws_to_player:
-            await ws.send_json({
-                "type": "error",
-                "code": ERR_NOT_IN_GAME,
-                "message": ERROR_MESSAGES[ERR_NOT_IN_GAME]
-            })
+            await self._send_error(ws, ERR_NOT_IN_GAME)
             return
 
         player = self._ws_to_player[ws]
         location_id = data.get("location_id")
 
         if not location_id:
-            await ws.send_json({
-                "type": "error",
-                "code": ERR_INVALID_LOCATION,
-                "message": ERROR_MESSAGES[ERR_INVALID_LOCATION]
-            })
+            await self._send_error(ws, ERR_INVALID_LOCATION)
             return
 
         # Record spy guess
         success, error_code = self.game_state.record_spy_guess(player.name, location_id)
 
         if not success:
-            await ws.send_json({
-                "type": "error",
-                "code": error_code,
-                "message": ERROR_MESSAGES.get(error_code, "Could not record guess.")
-            })
+            await self._send_error(ws, error_code, fallback="Could not record guess.")
             return
 
         _LOGGER.info("Spy guess submitted: %s -> %s", player.name, location_id)
@@ -1031,5 +1256,5 @@ class WebSocketHandler:
         self.game_state.phase = GamePhase.REVEAL
 
         # Broadcast state (spy guess ends voting)
-        await self.broadcast_state()
+        self._schedule_broadcast()
 
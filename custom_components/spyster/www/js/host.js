@@ -476,6 +476,8 @@ function startHeartbeat() {
   stopHeartbeat();
 
   // Send heartbeat every 10 seconds
+  // Keep the payload exactly { type: 'heartbeat' }: the server matches the
+  // serialized frame literally to skip JSON parsing
   heartbeatTimer = setInterval(() => {
     if (ws && ws.readyState === WebSocket.OPEN) {
       sendMessage({ type: 'heartbeat' });
@@ -2164,6 +2164,8 @@ class PlayerClient {
     this.stopHeartbeat();
 
     // Send heartbeat every 10 seconds
+    // Keep the payload exactly { type: 'heartbeat' }: the server matches the
+    // serialized frame literally to skip JSON parsing
     this.heartbeatTimer = setInterval(() => {
       if (this.ws && this.ws.readyState === WebSocket.OPEN) {
         this.sendMessage({ type: 'heartbeat' });
@@ -9,71 +9,145 @@ import asyncio
 import json
 import secrets
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from aiohttp import web, WSMsgType
 
+try:
+    import orjson
+except ImportError:  # Dev server also runs on a bare Python install
+    orjson = None
+
+if orjson is not None:
+    def dumps(obj):
+        """Serialize to a JSON str (clients parse text frames)."""
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+else:
+    def dumps(obj):
+        """Serialize to compact JSON, matching orjson's output size."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    loads = json.loads
+
 # Configuration
 HOST = "localhost"
 PORT = 8123
 WWW_DIR = Path(__file__).parent / "custom_components" / "spyster" / "www"
+OUTBOUND_QUEUE_SIZE = 16  # Pending state frames per client
 
 # Game state simulation
-game_state = {
-    "session_id": None,
-    "phase": "LOBBY",
-    "players": [],
-    "current_round": 0,
-    "round_count": 5,
-    "config": {
+@dataclass(slots=True)
+class DevGameState:
+    """Simulated game state (attribute access instead of dict key lookups)."""
+
+    session_id: str | None = None
+    phase: str = "LOBBY"
+    previous_phase: str | None = None
+    players: list = field(default_factory=list)  # Wire-format player dicts
+    connected_count: int = 0  # Kept in step with players by add_player()
+    current_round: int = 0
+    round_count: int = 5
+    config: dict = field(default_factory=lambda: {
         "round_duration_minutes": 7,
         "num_rounds": 5,
         "location_pack": "classic"
-    },
-    "timer": None,
-    "host_id": "host",
-    "created_at": None,
-}
+    })
+    timer: dict | None = None
+    host_id: str = "host"
+    created_at: float | None = None
 
-connected_clients = set()
 
+game_state = DevGameState()
 
-def create_session():
-    """Create a new game session."""
-    game_state["session_id"] = secrets.token_urlsafe(8)
-    game_state["created_at"] = time.time()
-    game_state["phase"] = "LOBBY"
-    game_state["players"] = []
-    game_state["current_round"] = 0
-    return game_state["session_id"]
+# ws -> asyncio.Queue of outbound state frames; doubles as the set of
+# connected clients, so connect/disconnect touch a single structure
+client_queues = {}
+last_broadcast = None  # Last state frame queued for every client
+qr_cache = {}  # session_id -> QR response payload
+state_template = {}  # Broadcast dict; session-constant keys set once per session
 
 
-def get_state_for_broadcast():
-    """Get current game state for WebSocket broadcast."""
-    return {
+def create_session():
+    """Create a new game session."""
+    qr_cache.clear()  # Join URL changes with the session
+    game_state.session_id = secrets.token_urlsafe(8)
+    game_state.created_at = time.time()
+    game_state.phase = "LOBBY"
+    game_state.players = []
+    game_state.connected_count = 0
+    game_state.current_round = 0
+    state_template.clear()
+    state_template.update({
         "type": "state",
-        "session_id": game_state["session_id"],
-        "phase": game_state["phase"],
-        "players": game_state["players"],
-        "player_count": len(game_state["players"]),
-        "current_round": game_state["current_round"],
-        "round_count": game_state["round_count"],
-        "config": game_state["config"],
-        "connected_count": len([p for p in game_state["players"] if p.get("connected")]),
-        "can_start": len([p for p in game_state["players"] if p.get("connected")]) >= 4,
+        "session_id": game_state.session_id,
+        "phase": None,
+        "players": None,
+        "player_count": 0,
+        "current_round": 0,
+        "round_count": game_state.round_count,
+        "config": game_state.config,
+        "connected_count": 0,
+        "can_start": False,
         "min_players": 4,
         "max_players": 10,
-    }
+    })
+    return game_state.session_id
+
 
+def add_player(name, is_host):
+    """Add a connected player and update the connected count."""
+    game_state.players.append({
+        "name": name,
+        "connected": True,
+        "is_host": is_host,
+        "disconnect_duration": None
+    })
+    game_state.connected_count += 1
 
-async def broadcast_state():
-    """Broadcast state to all connected clients."""
-    state = get_state_for_broadcast()
-    message = json.dumps(state)
-    for ws in list(connected_clients):
+
+def get_state_for_broadcast():
+    """Get current game state for WebSocket broadcast.
+
+    Returns the shared template with only the per-broadcast keys refreshed;
+    callers serialize it immediately and must not keep or mutate it.
+    """
+    state = state_template
+    state["phase"] = game_state.phase
+    state["players"] = game_state.players
+    state["player_count"] = len(game_state.players)
+    state["current_round"] = game_state.current_round
+    state["connected_count"] = game_state.connected_count
+    state["can_start"] = game_state.connected_count >= 4
+    return state
+
+
+async def sender_loop(ws, queue):
+    """Send queued state frames to one client, newest snapshot only."""
+    while True:
+        message = await queue.get()
+        # State frames are full snapshots: skip any superseded while sending
+        while not queue.empty():
+            message = queue.get_nowait()
         try:
             await ws.send_str(message)
         except Exception:
-            connected_clients.discard(ws)
+            client_queues.pop(ws, None)
+            return
+
+
+def broadcast_state():
+    """Queue current state for all connected clients (returns immediately)."""
+    global last_broadcast
+    message = dumps(get_state_for_broadcast())
+    if message == last_broadcast:
+        return  # Nothing changed since the last broadcast
+    last_broadcast = message
+    for queue in client_queues.values():
+        if queue.full():
+            queue.get_nowait()  # Drop the oldest; a newer snapshot follows
+        queue.put_nowait(message)
 
 
 async def handle_host_page(request):
@@ -81,7 +155,7 @@ async def handle_host_page(request):
     html_path = WWW_DIR / "host.html"
     if html_path.exists():
         # Create session if none exists
-        if not game_state["session_id"]:
+        if not game_state.session_id:
             create_session()
         return web.FileResponse(html_path)
     return web.Response(text="host.html not found", status=404)
@@ -95,159 +169,187 @@ async def handle_player_page(request):
     return web.Response(text="player.html not found", status=404)
 
 
-async def handle_static_css(request):
-    """Serve CSS files."""
-    filename = request.match_info.get("filename", "styles.css")
-    css_path = WWW_DIR / "css" / filename
-    if css_path.exists():
-        return web.FileResponse(css_path, headers={"Content-Type": "text/css"})
-    return web.Response(text=f"CSS file {filename} not found", status=404)
-
-
-async def handle_static_js(request):
-    """Serve JS files."""
-    filename = request.match_info.get("filename", "host.js")
-    js_path = WWW_DIR / "js" / filename
-    if js_path.exists():
-        return web.FileResponse(js_path, headers={"Content-Type": "application/javascript"})
-    return web.Response(text=f"JS file {filename} not found", status=404)
-
-
 async def handle_qr(request):
-    """Generate QR code."""
+    """Generate QR code (cached per session - the join URL only changes with it)."""
+    session_id = game_state.session_id
+    cached = qr_cache.get(session_id)
+    if cached is not None:
+        return web.json_response(cached)
+
+    join_url = f"http://{HOST}:{PORT}/api/spyster/player?session={session_id}"
     try:
         import qrcode
         import io
         import base64
 
-        join_url = f"http://{HOST}:{PORT}/api/spyster/player?session={game_state['session_id']}"
         qr = qrcode.QRCode(version=1, box_size=10, border=4)
         qr.add_data(join_url)
         qr.make(fit=True)
+        # make_image imports Pillow lazily, so it belongs under the guard too
         img = qr.make_image(fill_color="black", back_color="white")
 
         buffer = io.BytesIO()
         img.save(buffer, format="PNG")
-        qr_base64 = base64.b64encode(buffer.getvalue()).decode()
-
-        return web.json_response({
-            "qr_code": f"data:image/png;base64,{qr_base64}",
-            "join_url": join_url
-        })
+        qr_base64 = base64.b64encode(buffer.getbuffer()).decode()
     except ImportError:
-        # Return placeholder if qrcode not installed
+        # Return placeholder if qrcode (or Pillow) not installed
         return web.json_response({
             "qr_code": "",
-            "join_url": f"http://{HOST}:{PORT}/api/spyster/player?session={game_state['session_id']}",
+            "join_url": join_url,
             "error": "qrcode library not installed"
         })
 
+    qr_cache[session_id] = payload = {
+        "qr_code": f"data:image/png;base64,{qr_base64}",
+        "join_url": join_url
+    }
+    return web.json_response(payload)
+
 
 async def handle_websocket(request):
     """Handle WebSocket connections."""
     ws = web.WebSocketResponse()
     await ws.prepare(request)
 
-    connected_clients.add(ws)
-    print(f"[WS] Client connected. Total: {len(connected_clients)}")
+    queue = client_queues[ws] = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+    sender = asyncio.create_task(sender_loop(ws, queue))
+    print(f"[WS] Client connected. Total: {len(client_queues)}")
 
-    # Send initial state
-    await ws.send_str(json.dumps(get_state_for_broadcast()))
+    # Send initial state (through the queue so it can't overtake a broadcast)
+    queue.put_nowait(dumps(get_state_for_broadcast()))
 
     try:
         async for msg in ws:
             if msg.type == WSMsgType.TEXT:
                 try:
-                    data = json.loads(msg.data)
+                    data = loads(msg.data)
                     await handle_ws_message(ws, data)
                 except json.JSONDecodeError:
-                    await ws.send_str(json.dumps({"type": "error", "message": "Invalid JSON"}))
+                    await ws.send_str(dumps({"type": "error", "message": "Invalid JSON"}))
             elif msg.type == WSMsgType.ERROR:
                 print(f"[WS] Error: {ws.exception()}")
     finally:
-        connected_clients.discard(ws)
-        print(f"[WS] Client disconnected. Total: {len(connected_clients)}")
+        client_queues.pop(ws, None)
+        sender.cancel()
+        print(f"[WS] Client disconnected. Total: {len(client_queues)}")
 
     return ws
 
 
+async def handle_ping(ws, data):
+    """Answer a client ping."""
+    await ws.send_str(dumps({"type": "pong"}))
+
+
+async def handle_join(ws, data):
+    """Add a joining player."""
+    name = data.get("name", f"Player{len(game_state.players) + 1}")
+    add_player(name, is_host=len(game_state.players) == 0)
+    print(f"[GAME] Player joined: {name}")
+    broadcast_state()
+
+
+async def handle_admin(ws, data):
+    """Route an admin message to its action handler."""
+    await handle_admin_action(data.get("action"), data)
+
+
+async def handle_get_state(ws, data):
+    """Send current state to the requesting client."""
+    await ws.send_str(dumps(get_state_for_broadcast()))
+
+
 async def handle_ws_message(ws, data):
     """Handle incoming WebSocket messages."""
-    msg_type = data.get("type")
+    handler = WS_HANDLERS.get(data.get("type"))
+    if handler is not None:
+        await handler(ws, data)
+
+
+async def admin_start_game(data):
+    """Start the game if enough players are connected."""
+    if game_state.connected_count >= 4:
+        game_state.phase = "ROLES"
+        game_state.current_round = 1
+        print("[GAME] Game started!")
+        broadcast_state()
+
+        # Simulate role display timer
+        await asyncio.sleep(2)
+        game_state.phase = "QUESTIONING"
+        broadcast_state()
+    else:
+        print("[GAME] Not enough players to start")
+
+
+async def admin_skip_to_vote(data):
+    """Skip from questioning straight to voting."""
+    if game_state.phase == "QUESTIONING":
+        game_state.phase = "VOTE"
+        broadcast_state()
+
+
+async def admin_pause_game(data):
+    """Pause the game, remembering the current phase."""
+    game_state.previous_phase = game_state.phase
+    game_state.phase = "PAUSED"
+    broadcast_state()
+
+
+async def admin_resume_game(data):
+    """Resume the phase that was paused."""
+    if game_state.previous_phase:
+        game_state.phase = game_state.previous_phase
+        broadcast_state()
+
 
-    if msg_type == "ping":
-        await ws.send_str(json.dumps({"type": "pong"}))
+async def admin_end_game(data):
+    """End the game."""
+    game_state.phase = "END"
+    broadcast_state()
 
-    elif msg_type == "join":
-        name = data.get("name", f"Player{len(game_state['players']) + 1}")
-        player = {
-            "name": name,
-            "connected": True,
-            "is_host": len(game_state["players"]) == 0,
-            "disconnect_duration": None
-        }
-        game_state["players"].append(player)
-        print(f"[GAME] Player joined: {name}")
-        await broadcast_state()
 
-    elif msg_type == "admin":
-        action = data.get("action")
-        await handle_admin_action(action, data)
+async def admin_next_round(data):
+    """Advance to the next round, or end after the last one."""
+    game_state.current_round += 1
+    if game_state.current_round > game_state.round_count:
+        game_state.phase = "END"
+    else:
+        game_state.phase = "ROLES"
+        await asyncio.sleep(2)
+        game_state.phase = "QUESTIONING"
+    broadcast_state()
 
-    elif msg_type == "get_state":
-        await ws.send_str(json.dumps(get_state_for_broadcast()))
+
+async def admin_advance_turn(data):
+    """Advance the turn (simulated - just broadcasts state)."""
+    broadcast_state()
+
+
+WS_HANDLERS = {
+    "ping": handle_ping,
+    "join": handle_join,
+    "admin": handle_admin,
+    "get_state": handle_get_state,
+}
+
+ADMIN_HANDLERS = {
+    "start_game": admin_start_game,
+    "skip_to_vote": admin_skip_to_vote,
+    "pause_game": admin_pause_game,
+    "resume_game": admin_resume_game,
+    "end_game": admin_end_game,
+    "next_round": admin_next_round,
+    "advance_turn": admin_advance_turn,
+}
 
 
 async def handle_admin_action(action, data):
     """Handle admin actions from host."""
     print(f"[ADMIN] Action: {action}")
-
-    if action == "start_game":
-        if len([p for p in game_state["players"] if p.get("connected")]) >= 4:
-            game_state["phase"] = "ROLES"
-            game_state["current_round"] = 1
-            print("[GAME] Game started!")
-            await broadcast_state()
-
-            # Simulate role display timer
-            await asyncio.sleep(2)
-            game_state["phase"] = "QUESTIONING"
-            await broadcast_state()
-        else:
-            print("[GAME] Not enough players to start")
-
-    elif action == "skip_to_vote":
-        if game_state["phase"] == "QUESTIONING":
-            game_state["phase"] = "VOTE"
-            await broadcast_state()
-
-    elif action == "pause_game":
-        game_state["previous_phase"] = game_state["phase"]
-        game_state["phase"] = "PAUSED"
-        await broadcast_state()
-
-    elif action == "resume_game":
-        if game_state.get("previous_phase"):
-            game_state["phase"] = game_state["previous_phase"]
-            await broadcast_state()
-
-    elif action == "end_game":
-        game_state["phase"] = "END"
-        await broadcast_state()
-
-    elif action == "next_round":
-        game_state["current_round"] += 1
-        if game_state["current_round"] > game_state["round_count"]:
-            game_state["phase"] = "END"
-        else:
-            game_state["phase"] = "ROLES"
-            await asyncio.sleep(2)
-            game_state["phase"] = "QUESTIONING"
-        await broadcast_state()
-
-    elif action == "advance_turn":
-        # Just broadcast state - turn advancement is simulated
-        await broadcast_state()
+    handler = ADMIN_HANDLERS.get(action)
+    if handler is not None:
+        await handler(data)
 
 
 async def add_test_players():
@@ -256,16 +358,10 @@ async def add_test_players():
 
     test_names = ["Alice", "Bob", "Charlie", "Diana"]
     for name in test_names:
-        player = {
-            "name": name,
-            "connected": True,
-            "is_host": name == "Alice",
-            "disconnect_duration": None
-        }
-        game_state["players"].append(player)
+        add_player(name, is_host=name == "Alice")
 
     print(f"[TEST] Added {len(test_names)} test players")
-    await broadcast_state()
+    broadcast_state()
 
 
 def create_app():
@@ -275,8 +371,10 @@ def create_app():
     # Routes matching Home Assistant integration
     app.router.add_get("/api/spyster/host", handle_host_page)
     app.router.add_get("/api/spyster/player", handle_player_page)
-    app.router.add_get("/api/spyster/static/css/{filename}", handle_static_css)
-    app.router.add_get("/api/spyster/static/js/{filename}", handle_static_js)
+    # aiohttp's static handler streams via sendfile and answers
+    # conditional requests (If-Modified-Since) with 304
+    app.router.add_static("/api/spyster/static/css/", WWW_DIR / "css")
+    app.router.add_static("/api/spyster/static/js/", WWW_DIR / "js")
     app.router.add_get("/api/spyster/qr", handle_qr)
     app.router.add_get("/api/spyster/ws", handle_websocket)
 
@@ -292,7 +390,8 @@ async def main():
     runner = web.AppRunner(app)
     await runner.setup()
 
-    site = web.TCPSite(runner, HOST, PORT)
+    # aiohttp already sets TCP_NODELAY on accepted connections
+    site = web.TCPSite(runner, HOST, PORT, backlog=1024)
     await site.start()
 
     print(f"""
@@ -301,7 +400,7 @@ async def main():
 ╠════════════════════════════════════════════════════════════════╣
 ║  Host Page:   http://{HOST}:{PORT}/api/spyster/host              ║
 ║  Player Page: http://{HOST}:{PORT}/api/spyster/player            ║
-║  Session ID:  {game_state['session_id']:<43} ║
+║  Session ID:  {game_state.session_id:<43} ║
 ╠════════════════════════════════════════════════════════════════╣
 ║  Press Ctrl+C to stop                                          ║
 ╚════════════════════════════════════════════════════════════════╝
@@ -317,6 +416,14 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        import uvloop
+    except ImportError:
+        uvloop = None  # Optional: stdlib event loop works fine for development
+
+    try:
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\n[SERVER] Shutting down...")
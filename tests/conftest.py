@@ -1,23 +1,36 @@
 """Shared test fixtures for Spyster tests."""
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock
-from homeassistant.core import HomeAssistant
+
+
+async def _run_job(func, *args):
+    """Stand-in for hass.async_add_executor_job that runs the job inline."""
+    return func(*args)
 
 
 @pytest.fixture
 def mock_hass():
-    """Create a mock Home Assistant instance for testing."""
-    hass = MagicMock(spec=HomeAssistant)
-    hass.data = {}
-    return hass
+    """Create a lightweight Home Assistant stand-in for testing.
+
+    A plain namespace with just the attributes the integration touches is far
+    cheaper than MagicMock(spec=HomeAssistant). Tests that need call tracking
+    build their own Mock.
+    """
+    return SimpleNamespace(
+        data={},
+        config=SimpleNamespace(api=SimpleNamespace(base_url=None)),
+        http=SimpleNamespace(register_view=lambda view: None),
+        async_add_executor_job=_run_job,
+    )
 
 
 @pytest.fixture
 def mock_config_entry():
-    """Create a mock config entry for testing."""
-    entry = MagicMock()
-    entry.data = {
-        "host": "localhost",
-        "port": 8123
-    }
-    return entry
+    """Create a lightweight config entry stand-in for testing."""
+    return SimpleNamespace(
+        data={
+            "host": "localhost",
+            "port": 8123
+        }
+    )
@@ -0,0 +1,24 @@
+"""Shared test doubles for Spyster tests."""
+
+
+class FakeWS:
+    """Hand-rolled stand-in for aiohttp's WebSocketResponse.
+
+    Records text frames and close calls in plain lists, which is far cheaper
+    to build than an AsyncMock and its child mocks.
+    """
+
+    __slots__ = ("closed", "sent", "close_calls")
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.sent: list[str] = []
+        self.close_calls: list[tuple[int, bytes]] = []
+
+    async def send_str(self, data: str) -> None:
+        self.sent.append(data)
+
+    async def close(self, *, code: int = 1000, message: bytes = b"") -> bool:
+        self.closed = True
+        self.close_calls.append((code, message))
+        return True
@@ -28,44 +28,25 @@ def test_valid_config():
     assert error is None
 
 
-def test_invalid_round_duration_too_low():
-    """Test validation rejects round duration below minimum."""
-    config = GameConfig(round_duration_minutes=0)
-    valid, error = config.validate()
-    assert valid is False
-    assert error == ERR_CONFIG_INVALID_DURATION
-
-
-def test_invalid_round_duration_too_high():
-    """Test validation rejects round duration above maximum."""
-    config = GameConfig(round_duration_minutes=31)
-    valid, error = config.validate()
-    assert valid is False
-    assert error == ERR_CONFIG_INVALID_DURATION
-
-
-def test_invalid_num_rounds_too_low():
-    """Test validation rejects invalid number of rounds (too low)."""
-    config = GameConfig(num_rounds=0)
-    valid, error = config.validate()
-    assert valid is False
-    assert error == ERR_CONFIG_INVALID_ROUNDS
-
-
-def test_invalid_num_rounds_too_high():
-    """Test validation rejects invalid number of rounds (too high)."""
-    config = GameConfig(num_rounds=21)
+@pytest.mark.parametrize(
+    ("field", "value", "expected_error"),
+    [
+        ("round_duration_minutes", 0, ERR_CONFIG_INVALID_DURATION),
+        ("round_duration_minutes", 31, ERR_CONFIG_INVALID_DURATION),
+        ("num_rounds", 0, ERR_CONFIG_INVALID_ROUNDS),
+        ("num_rounds", 21, ERR_CONFIG_INVALID_ROUNDS),
+        ("location_pack", "nonexistent_pack", ERR_CONFIG_INVALID_PACK),
+    ],
+)
+def test_invalid_config_value(field, value, expected_error):
+    """Test validation rejects out-of-range values and unknown packs."""
+    config = GameConfig(**{field: value})
     valid, error = config.validate()
     assert valid is False
-    assert error == ERR_CONFIG_INVALID_ROUNDS
-
+    assert error == expected_error
 
-def test_invalid_location_pack():
-    """Test validation rejects non-existent location pack."""
-    config = GameConfig(location_pack="nonexistent_pack")
-    valid, error = config.validate()
-    assert valid is False
-    assert error == ERR_CONFIG_INVALID_PACK
+    # Single-field validation agrees with full validation
+    assert GameConfig().validate_field(field, value) == (False, expected_error)
 
 
 def test_valid_location_pack():
@@ -145,6 +126,22 @@ def test_gamestate_config_update_in_lobby():
     assert state.config.location_pack == "classic"
 
 
+def test_gamestate_num_rounds_normalized_on_update():
+    """Test GameState caches normalized num_rounds whenever config changes."""
+    from custom_components.spyster.game.state import GameState, GamePhase
+
+    state = GameState()
+    state.phase = GamePhase.LOBBY
+    assert state._num_rounds == CONFIG_DEFAULT_ROUNDS
+
+    state.update_config("num_rounds", 3)
+    assert state._num_rounds == 3
+
+    # Invalid update is rejected; the cached value stays in step with config
+    state.update_config("num_rounds", 0)
+    assert state._num_rounds == 3
+
+
 def test_gamestate_config_update_phase_guard():
     """Test GameState.update_config() rejects updates after game starts."""
     from custom_components.spyster.game.state import GameState, GamePhase
@@ -158,24 +155,25 @@ def test_gamestate_config_update_phase_guard():
     assert error == ERR_CONFIG_GAME_STARTED
 
 
-def test_gamestate_config_update_invalid_value_reverts():
-    """Test GameState.update_config() reverts to defaults on validation failure."""
+def test_gamestate_config_update_invalid_value_rejected():
+    """Test GameState.update_config() keeps current config on validation failure."""
     from custom_components.spyster.game.state import GameState, GamePhase
     from custom_components.spyster.const import ERR_CONFIG_INVALID_DURATION
 
     state = GameState()
     state.phase = GamePhase.LOBBY
 
-    # Set valid value first
+    # Set valid values first
     state.update_config("round_duration_minutes", 10)
+    state.update_config("num_rounds", 3)
     assert state.config.round_duration_minutes == 10
 
-    # Try invalid value - should revert to defaults
+    # Try invalid value - rejected, previous values untouched
     success, error = state.update_config("round_duration_minutes", 999)
     assert success is False
     assert error == ERR_CONFIG_INVALID_DURATION
-    # Config reverted to defaults
-    assert state.config.round_duration_minutes == CONFIG_DEFAULT_ROUND_DURATION
+    assert state.config.round_duration_minutes == 10
+    assert state.config.num_rounds == 3
 
 
 def test_gamestate_config_in_lobby_state():
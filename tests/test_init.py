@@ -1,8 +1,19 @@
 """Tests for Spyster integration initialization."""
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from custom_components.spyster import async_setup_entry, async_unload_entry
 from custom_components.spyster.const import DOMAIN
+from custom_components.spyster.game.content import clear_cache, get_location_list
+
+
+@pytest.fixture(autouse=True)
+def reset_content():
+    """Drop packs loaded by setup so they don't leak into other tests."""
+    clear_cache()
+    yield
+    clear_cache()
 
 
 @pytest.mark.asyncio
@@ -16,6 +27,9 @@ async def test_async_setup_entry_initializes_hass_data(mock_hass, mock_config_en
     assert DOMAIN in mock_hass.data
     assert "config" in mock_hass.data[DOMAIN]
     assert mock_hass.data[DOMAIN]["config"] == mock_config_entry.data
+    assert "ws_handler" in mock_hass.data[DOMAIN]
+    # Bundled location packs are preloaded during setup
+    assert len(get_location_list("classic")) > 0
 
 
 @pytest.mark.asyncio
@@ -48,6 +62,19 @@ async def test_async_unload_entry_cleans_up_data(mock_hass, mock_config_entry):
     assert DOMAIN not in mock_hass.data
 
 
+@pytest.mark.asyncio
+async def test_async_unload_entry_shuts_down_ws_handler(mock_hass, mock_config_entry):
+    """Test that async_unload_entry stops the WebSocket handler's background work."""
+    ws_handler = MagicMock()
+    ws_handler.shutdown = AsyncMock()
+    mock_hass.data[DOMAIN] = {"ws_handler": ws_handler}
+
+    result = await async_unload_entry(mock_hass, mock_config_entry)
+
+    assert result is True
+    ws_handler.shutdown.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_async_unload_entry_handles_missing_domain(mock_hass, mock_config_entry):
     """Test that async_unload_entry handles case where DOMAIN is not in hass.data."""
@@ -63,7 +90,8 @@ async def test_async_unload_entry_handles_missing_domain(mock_hass, mock_config_
 async def test_async_setup_entry_handles_errors_gracefully(mock_hass, mock_config_entry):
     """Test that async_setup_entry handles errors and returns False."""
     # Setup - make setdefault raise an exception
-    mock_hass.data.setdefault = lambda *args: (_ for _ in ()).throw(RuntimeError("Test error"))
+    mock_hass.data = MagicMock()
+    mock_hass.data.setdefault.side_effect = RuntimeError("Test error")
 
     # Execute
     result = await async_setup_entry(mock_hass, mock_config_entry)
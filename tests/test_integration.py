@@ -3,8 +3,12 @@
 These tests verify the integration works with real Home Assistant components
 rather than mocks, ensuring actual import and registration succeed.
 """
-import pytest
+import json
+import os
+from pathlib import Path
 from unittest.mock import MagicMock
+
+import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 
@@ -50,46 +54,53 @@ async def test_integration_loads_in_home_assistant():
     assert DOMAIN not in hass.data, "hass.data should be cleaned up after unload"
 
 
+@pytest.fixture(scope="session")
+def spyster_base():
+    """Path of the integration package, resolved once per session."""
+    return Path(__file__).parent.parent / "custom_components" / "spyster"
+
+
+@pytest.fixture(scope="session")
+def spyster_files(spyster_base):
+    """Entry names in the package and its game/ and server/ dirs (one scandir each)."""
+    files = {entry.name for entry in os.scandir(spyster_base)}
+    for subdir in ("game", "server"):
+        if subdir in files:
+            files |= {f"{subdir}/{entry.name}" for entry in os.scandir(spyster_base / subdir)}
+    return files
+
+
+@pytest.fixture(scope="session")
+def manifest(spyster_base):
+    """Parsed manifest.json, loaded once per session (read-only)."""
+    return json.loads((spyster_base / "manifest.json").read_bytes())
+
+
 @pytest.mark.asyncio
-async def test_directory_structure_exists():
+async def test_directory_structure_exists(spyster_files):
     """Test that directory structure follows Beatify pattern.
 
     Acceptance Criteria #1: Directory structure follows Beatify pattern.
     """
-    import os
-    from pathlib import Path
-
-    # Get the base directory of the integration
-    base_dir = Path(__file__).parent.parent / "custom_components" / "spyster"
-
-    # Verify required directories exist
-    assert base_dir.exists(), "Base integration directory should exist"
-    assert (base_dir / "game").exists(), "game/ subdirectory should exist"
-    assert (base_dir / "server").exists(), "server/ subdirectory should exist"
+    # Verify required directories exist (the base dir exists or scandir failed)
+    assert "game" in spyster_files, "game/ subdirectory should exist"
+    assert "server" in spyster_files, "server/ subdirectory should exist"
 
     # Verify required files exist
-    assert (base_dir / "__init__.py").exists(), "__init__.py should exist"
-    assert (base_dir / "manifest.json").exists(), "manifest.json should exist"
-    assert (base_dir / "const.py").exists(), "const.py should exist"
-    assert (base_dir / "game" / "__init__.py").exists(), "game/__init__.py should exist"
-    assert (base_dir / "game" / "state.py").exists(), "game/state.py should exist"
-    assert (base_dir / "server" / "__init__.py").exists(), "server/__init__.py should exist"
+    assert "__init__.py" in spyster_files, "__init__.py should exist"
+    assert "manifest.json" in spyster_files, "manifest.json should exist"
+    assert "const.py" in spyster_files, "const.py should exist"
+    assert "game/__init__.py" in spyster_files, "game/__init__.py should exist"
+    assert "game/state.py" in spyster_files, "game/state.py should exist"
+    assert "server/__init__.py" in spyster_files, "server/__init__.py should exist"
 
 
 @pytest.mark.asyncio
-async def test_manifest_metadata():
+async def test_manifest_metadata(manifest):
     """Test that manifest.json contains correct HACS metadata.
 
     Acceptance Criteria #2: Spyster appears as installable with correct metadata.
     """
-    import json
-    from pathlib import Path
-
-    # Load manifest.json
-    manifest_path = Path(__file__).parent.parent / "custom_components" / "spyster" / "manifest.json"
-    with open(manifest_path, "r") as f:
-        manifest = json.load(f)
-
     # Verify required fields
     assert manifest["domain"] == "spyster", "Domain should be 'spyster'"
     assert manifest["name"] == "Spyster", "Name should be 'Spyster'"
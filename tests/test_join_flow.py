@@ -1,7 +1,9 @@
 """Unit tests for player join flow (Story 2.2)."""
 import asyncio
+import json
+import re
 import secrets
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -10,11 +12,48 @@ from custom_components.spyster.const import (
     ERR_GAME_FULL,
     ERR_NAME_INVALID,
     ERROR_MESSAGES,
+    LOBBY_BROADCAST_DELAY,
+    MAX_NAME_LENGTH,
     MAX_PLAYERS,
 )
 from custom_components.spyster.game.player import PlayerSession
 from custom_components.spyster.game.state import GamePhase, GameState
-from custom_components.spyster.server.websocket import WebSocketHandler
+from custom_components.spyster.server.websocket import WebSocketHandler, _validate_name
+from tests.helpers import FakeWS
+
+
+_URLSAFE_B64_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def sent_messages(ws) -> list[dict]:
+    """Decode the JSON text frames sent to a fake WebSocket."""
+    return [json.loads(frame) for frame in ws.sent]
+
+
+async def drain_background_tasks(handler: WebSocketHandler) -> None:
+    """Run fire-and-forget tasks (e.g. replaced-session closes) to completion.
+
+    Per-connection writer tasks never finish on their own, so they are left
+    out of the drain.
+    """
+    pending = asyncio.all_tasks() - {
+        asyncio.current_task(),
+        *handler._writer_tasks.values(),
+    }
+    await asyncio.gather(*pending)
+
+
+class YieldingFakeWS(FakeWS):
+    """FakeWS whose send yields to the event loop, as a real socket write can.
+
+    Lets concurrently gathered joins actually interleave at the send.
+    """
+
+    __slots__ = ()
+
+    async def send_str(self, data: str) -> None:
+        await asyncio.sleep(0)
+        await super().send_str(data)
 
 
 @pytest.fixture
@@ -32,14 +71,70 @@ def ws_handler(game_state):
     return WebSocketHandler(game_state)
 
 
+@pytest.fixture(scope="module")
+def shared_game_state():
+    """Create one LOBBY game state for tests whose joins are all rejected."""
+    state = GameState()
+    state.phase = GamePhase.LOBBY
+    state.session_id = "test_session_123"
+    return state
+
+
+@pytest.fixture
+def readonly_ws_handler(shared_game_state):
+    """Create a handler over the shared game state for error-path tests.
+
+    Fails the test if a join got through and left the shared state dirty.
+    """
+    yield WebSocketHandler(shared_game_state)
+    assert len(shared_game_state.players) == 0
+    assert len(shared_game_state.sessions) == 0
+
+
 @pytest.fixture
 def mock_ws():
-    """Create mock WebSocket response."""
-    ws = AsyncMock()
-    ws.closed = False
-    ws.close = AsyncMock()
-    ws.send_json = AsyncMock()
-    return ws
+    """Create a fake WebSocket response."""
+    return FakeWS()
+
+
+@pytest.fixture(scope="module")
+def full_lobby():
+    """Build MAX_PLAYERS connected players once for the module.
+
+    A rejected join never touches the existing sessions, so one set can be
+    shared by every test that needs a full lobby.
+    """
+    tokens = [secrets.token_urlsafe(16) for _ in range(MAX_PLAYERS)]
+    return {
+        f"Player{i}": PlayerSession(
+            name=f"Player{i}",
+            session_token=token,
+            ws=FakeWS(),
+            connected=True,
+        )
+        for i, token in enumerate(tokens)
+    }
+
+
+@pytest.mark.parametrize(
+    "raw,expected_name,valid",
+    [
+        ("Alice", "Alice", True),
+        ("  Bob  ", "Bob", True),
+        ("A" * MAX_NAME_LENGTH, "A" * MAX_NAME_LENGTH, True),
+        ("", "", False),
+        ("   ", "", False),
+        ("A" * (MAX_NAME_LENGTH + 1), "A" * (MAX_NAME_LENGTH + 1), False),
+        ("Al<ice", "Al<ice", False),
+        ("Tom & Jerry", "Tom & Jerry", False),
+        (None, "", False),
+    ],
+)
+def test_validate_name(raw, expected_name, valid):
+    """Test name normalization, length bounds and forbidden characters."""
+    name, error = _validate_name(raw)
+    assert name == expected_name
+    assert (error is None) is valid
 
 
 @pytest.mark.asyncio
@@ -58,12 +153,12 @@ async def test_valid_join(ws_handler, game_state, mock_ws):
     assert game_state.player_count == 1
 
     # Verify success response sent with correct field names
-    mock_ws.send_json.assert_any_call({
+    assert {
         "type": "join_success",
         "player_name": player_name,
         "session_token": game_state.players[player_name].session_token,
         "is_host": False
-    })
+    } in sent_messages(mock_ws)
 
     # Verify session token is cryptographically secure (16 bytes URL-safe)
     token = game_state.players[player_name].session_token
@@ -72,47 +167,42 @@ async def test_valid_join(ws_handler, game_state, mock_ws):
 
 
 @pytest.mark.asyncio
-async def test_invalid_name_empty(ws_handler, mock_ws):
-    """Test join with empty name."""
-    data = {"name": ""}
-
-    await ws_handler._handle_join(mock_ws, data)
-
-    # Verify error response
-    mock_ws.send_json.assert_called_once()
-    call_args = mock_ws.send_json.call_args[0][0]
-    assert call_args["type"] == "error"
-    assert call_args["code"] == ERR_NAME_INVALID
-    assert call_args["message"] == ERROR_MESSAGES[ERR_NAME_INVALID]
-
-
-@pytest.mark.asyncio
-async def test_invalid_name_too_long(ws_handler, mock_ws):
-    """Test join with name > 20 characters."""
-    long_name = "A" * 21
-    data = {"name": long_name}
-
-    await ws_handler._handle_join(mock_ws, data)
-
-    # Verify error response
-    mock_ws.send_json.assert_called_once()
-    call_args = mock_ws.send_json.call_args[0][0]
-    assert call_args["type"] == "error"
-    assert call_args["code"] == ERR_NAME_INVALID
-
-
-@pytest.mark.asyncio
-async def test_invalid_name_whitespace_only(ws_handler, mock_ws):
-    """Test join with whitespace-only name."""
-    data = {"name": "   "}
-
-    await ws_handler._handle_join(mock_ws, data)
-
-    # Verify error response
-    mock_ws.send_json.assert_called_once()
-    call_args = mock_ws.send_json.call_args[0][0]
-    assert call_args["type"] == "error"
-    assert call_args["code"] == ERR_NAME_INVALID
+@pytest.mark.parametrize(
+    "raw_name,stored_name,error_code",
+    [
+        pytest.param("", None, ERR_NAME_INVALID, id="empty"),
+        pytest.param("   ", None, ERR_NAME_INVALID, id="whitespace-only"),
+        pytest.param("A" * 21, None, ERR_NAME_INVALID, id="21-chars"),
+        pytest.param("A" * 20, "A" * 20, None, id="20-chars"),
+        pytest.param("  Alice  ", "Alice", None, id="trimmed"),
+    ],
+)
+async def test_name_validation(
+    ws_handler, game_state, mock_ws, raw_name, stored_name, error_code
+):
+    """Test join name bounds and trimming end to end."""
+    await ws_handler._handle_join(mock_ws, {"name": raw_name})
+
+    if error_code is not None:
+        # Verify error response and nothing stored
+        assert sent_messages(mock_ws) == [{
+            "type": "error",
+            "code": error_code,
+            "message": ERROR_MESSAGES[error_code],
+        }]
+        assert len(game_state.players) == 0
+        return
+
+    # Verify player added under the trimmed name
+    assert list(game_state.players) == [stored_name]
+
+    # Verify success response uses the stored name
+    assert {
+        "type": "join_success",
+        "player_name": stored_name,
+        "session_token": game_state.players[stored_name].session_token,
+        "is_host": False
+    } in sent_messages(mock_ws)
 
 
 @pytest.mark.asyncio
@@ -121,10 +211,7 @@ async def test_duplicate_name_replaces_old_session(ws_handler, game_state):
     player_name = "Alice"
 
     # Create first session
-    ws1 = AsyncMock()
-    ws1.closed = False
-    ws1.close = AsyncMock()
-    ws1.send_json = AsyncMock()
+    ws1 = FakeWS()
 
     data1 = {"name": player_name}
     await ws_handler._handle_join(ws1, data1)
@@ -135,16 +222,14 @@ async def test_duplicate_name_replaces_old_session(ws_handler, game_state):
     old_token = game_state.players[player_name].session_token
 
     # Create second session with same name
-    ws2 = AsyncMock()
-    ws2.closed = False
-    ws2.close = AsyncMock()
-    ws2.send_json = AsyncMock()
+    ws2 = FakeWS()
 
     data2 = {"name": player_name}
     await ws_handler._handle_join(ws2, data2)
 
     # Verify old WebSocket was closed
-    ws1.close.assert_called_once()
+    await drain_background_tasks(ws_handler)
+    assert len(ws1.close_calls) == 1
 
     # Verify only one player in game (old removed, new added)
     assert len(game_state.players) == 1
@@ -156,20 +241,10 @@ async def test_duplicate_name_replaces_old_session(ws_handler, game_state):
 
 
 @pytest.mark.asyncio
-async def test_game_full(ws_handler, game_state, mock_ws):
+async def test_game_full(ws_handler, game_state, mock_ws, full_lobby):
     """Test join when game has 10 players."""
-    # Add MAX_PLAYERS players
-    for i in range(MAX_PLAYERS):
-        ws = AsyncMock()
-        ws.closed = False
-        player = PlayerSession(
-            name=f"Player{i}",
-            session_token=secrets.token_urlsafe(16),
-            ws=ws,
-            connected=True,
-        )
-        game_state.players[player.name] = player
-
+    # Fill the lobby with MAX_PLAYERS players
+    game_state.players = dict(full_lobby)
     game_state.player_count = len(game_state.players)
 
     # Try to add 11th player
@@ -177,8 +252,8 @@ async def test_game_full(ws_handler, game_state, mock_ws):
     await ws_handler._handle_join(mock_ws, data)
 
     # Verify error response
-    mock_ws.send_json.assert_called_once()
-    call_args = mock_ws.send_json.call_args[0][0]
+    assert len(mock_ws.sent) == 1
+    call_args = sent_messages(mock_ws)[-1]
     assert call_args["type"] == "error"
     assert call_args["code"] == ERR_GAME_FULL
     assert call_args["message"] == ERROR_MESSAGES[ERR_GAME_FULL]
@@ -196,8 +271,8 @@ async def test_join_after_game_started(ws_handler, game_state, mock_ws):
     await ws_handler._handle_join(mock_ws, data)
 
     # Verify error response
-    mock_ws.send_json.assert_called_once()
-    call_args = mock_ws.send_json.call_args[0][0]
+    assert len(mock_ws.sent) == 1
+    call_args = sent_messages(mock_ws)[-1]
     assert call_args["type"] == "error"
     assert call_args["code"] == ERR_GAME_ALREADY_STARTED
     assert call_args["message"] == ERROR_MESSAGES[ERR_GAME_ALREADY_STARTED]
@@ -208,64 +283,84 @@ async def test_join_after_game_started(ws_handler, game_state, mock_ws):
 
 @pytest.mark.asyncio
 async def test_multiple_players_join(ws_handler, game_state):
-    """Test multiple players joining in sequence."""
+    """Test multiple players joining concurrently."""
     player_names = ["Alice", "Bob", "Charlie"]
-
-    for name in player_names:
-        ws = AsyncMock()
-        ws.closed = False
-        ws.send_json = AsyncMock()
-
-        data = {"name": name}
-        await ws_handler._handle_join(ws, data)
-
-        # Verify player added
-        assert name in game_state.players
+    joins = [(YieldingFakeWS(), {"name": name}) for name in player_names]
+
+    await asyncio.gather(*(ws_handler._handle_join(ws, data) for ws, data in joins))
+
+    # Verify every player added with their own connection and session
+    for ws, data in joins:
+        session = game_state.players[data["name"]]
+        assert session.ws is ws
+        assert ws_handler._ws_to_player[ws] is session
+        assert sent_messages(ws) == [{
+            "type": "join_success",
+            "player_name": data["name"],
+            "session_token": session.session_token,
+            "is_host": False,
+        }]
 
     # Verify all players in game
     assert len(game_state.players) == len(player_names)
     assert game_state.player_count == len(player_names)
 
 
-@pytest.mark.asyncio
-async def test_name_trimming(ws_handler, game_state, mock_ws):
-    """Test that player names are trimmed of whitespace."""
-    data = {"name": "  Alice  "}
-
-    await ws_handler._handle_join(mock_ws, data)
-
-    # Verify player added with trimmed name
-    assert "Alice" in game_state.players
-    assert "  Alice  " not in game_state.players
-
-
 @pytest.mark.asyncio
 async def test_broadcast_state_after_join(ws_handler, game_state):
     """Test that state is broadcast after successful join."""
     # Add first player
-    ws1 = AsyncMock()
-    ws1.closed = False
-    ws1.send_json = AsyncMock()
+    ws1 = FakeWS()
 
     data1 = {"name": "Alice"}
     await ws_handler._handle_join(ws1, data1)
 
     # Clear previous calls
-    ws1.send_json.reset_mock()
+    ws1.sent.clear()
 
     # Add second player
-    ws2 = AsyncMock()
-    ws2.closed = False
-    ws2.send_json = AsyncMock()
+    ws2 = FakeWS()
 
     data2 = {"name": "Bob"}
     await ws_handler._handle_join(ws2, data2)
 
+    # Let the coalesced lobby broadcast fire
+    await asyncio.sleep(LOBBY_BROADCAST_DELAY * 2)
+
     # Verify both players received state broadcast
     # Alice should receive state update (via broadcast_state)
-    assert ws1.send_json.called
+    assert ws1.sent
     # Bob receives join_success and state via broadcast
-    assert ws2.send_json.call_count >= 2
+    assert len(ws2.sent) >= 2
+
+
+@pytest.mark.asyncio
+async def test_joiner_receives_state_once_via_broadcast(ws_handler, game_state, mock_ws):
+    """Test joiner gets join_success immediately and a single state via broadcast."""
+    await ws_handler._handle_join(mock_ws, {"name": "Alice"})
+
+    assert [m["type"] for m in sent_messages(mock_ws)] == ["join_success"]
+
+    await asyncio.sleep(LOBBY_BROADCAST_DELAY * 2)
+
+    assert [m["type"] for m in sent_messages(mock_ws)] == ["join_success", "state"]
+
+
+@pytest.mark.asyncio
+async def test_join_burst_coalesces_broadcast(ws_handler, game_state):
+    """Test that a burst of joins triggers a single state broadcast."""
+    ws_handler.broadcast_state = AsyncMock()
+
+    for name in ("Alice", "Bob", "Carol"):
+        ws = FakeWS()
+        await ws_handler._handle_join(ws, {"name": name})
+
+    assert ws_handler.broadcast_state.call_count == 0
+
+    await asyncio.sleep(LOBBY_BROADCAST_DELAY * 2)
+
+    assert ws_handler.broadcast_state.call_count == 1
+    assert ws_handler._lobby_broadcast_pending is None
 
 
 @pytest.mark.asyncio
@@ -302,89 +397,63 @@ async def test_ws_to_player_mapping(ws_handler, game_state, mock_ws):
     assert ws_handler._ws_to_player[mock_ws].name == "Alice"
 
 @pytest.mark.asyncio
-async def test_xss_attack_in_name(ws_handler, mock_ws):
-    """Test join with XSS attack attempt in name."""
-    malicious_names = [
+@pytest.mark.parametrize(
+    "mal_name",
+    [
         "<script>alert('xss')</script>",
         "<img src=x onerror=alert(1)>",
         "Alice<script>",
         "Bob';DROP TABLE players;--",
         'Name"onclick="alert(1)"',
-    ]
-
-    for mal_name in malicious_names:
-        data = {"name": mal_name}
-        await ws_handler._handle_join(mock_ws, data)
+    ],
+)
+async def test_xss_attack_in_name(readonly_ws_handler, mock_ws, mal_name):
+    """Test join with XSS attack attempt in name."""
+    await readonly_ws_handler._handle_join(mock_ws, {"name": mal_name})
 
-        # Verify error response
-        mock_ws.send_json.assert_called()
-        call_args = mock_ws.send_json.call_args[0][0]
-        assert call_args["type"] == "error"
-        assert call_args["code"] == ERR_NAME_INVALID
-        mock_ws.send_json.reset_mock()
+    # Verify error response
+    assert len(mock_ws.sent) == 1
+    call_args = sent_messages(mock_ws)[-1]
+    assert call_args["type"] == "error"
+    assert call_args["code"] == ERR_NAME_INVALID
 
 
 @pytest.mark.asyncio
-async def test_special_characters_rejected(ws_handler, mock_ws):
+@pytest.mark.parametrize(
+    "invalid_name",
+    ["Alice&Bob", "Test;Name", "User<Name", "Name>Test", "Test'Name", 'Test"Name'],
+)
+async def test_special_characters_rejected(readonly_ws_handler, mock_ws, invalid_name):
     """Test that special characters are rejected."""
-    invalid_names = ["Alice&Bob", "Test;Name", "User<Name", "Name>Test", "Test'Name", 'Test"Name']
+    await readonly_ws_handler._handle_join(mock_ws, {"name": invalid_name})
 
-    for invalid_name in invalid_names:
-        data = {"name": invalid_name}
-        await ws_handler._handle_join(mock_ws, data)
-
-        # Verify error response
-        call_args = mock_ws.send_json.call_args[0][0]
-        assert call_args["type"] == "error"
-        assert call_args["code"] == ERR_NAME_INVALID
-        mock_ws.send_json.reset_mock()
+    # Verify error response
+    call_args = sent_messages(mock_ws)[-1]
+    assert call_args["type"] == "error"
+    assert call_args["code"] == ERR_NAME_INVALID
 
 
 @pytest.mark.asyncio
-async def test_missing_name_field(ws_handler, mock_ws):
+async def test_missing_name_field(readonly_ws_handler, mock_ws):
     """Test join with missing 'name' field in message."""
     data = {"type": "join"}  # No 'name' field
 
-    await ws_handler._handle_join(mock_ws, data)
+    await readonly_ws_handler._handle_join(mock_ws, data)
 
     # Verify error response for invalid name
-    mock_ws.send_json.assert_called_once()
-    call_args = mock_ws.send_json.call_args[0][0]
+    assert len(mock_ws.sent) == 1
+    call_args = sent_messages(mock_ws)[-1]
     assert call_args["type"] == "error"
     assert call_args["code"] == ERR_NAME_INVALID
 
 
-@pytest.mark.asyncio
-async def test_name_exactly_20_characters(ws_handler, game_state, mock_ws):
-    """Test join with name exactly at maximum length (20 chars)."""
-    name_20_chars = "A" * 20
-    data = {"name": name_20_chars}
-
-    await ws_handler._handle_join(mock_ws, data)
-
-    # Verify player added successfully
-    assert name_20_chars in game_state.players
-    assert len(game_state.players) == 1
-
-    # Verify success response
-    mock_ws.send_json.assert_any_call({
-        "type": "join_success",
-        "player_name": name_20_chars,
-        "session_token": game_state.players[name_20_chars].session_token,
-        "is_host": False
-    })
-
-
 @pytest.mark.asyncio
 async def test_duplicate_name_closes_old_ws_after_registration(ws_handler, game_state):
     """Test that old WebSocket is closed AFTER new player is registered (race condition fix)."""
     player_name = "Alice"
 
     # Create first session
-    ws1 = AsyncMock()
-    ws1.closed = False
-    ws1.close = AsyncMock()
-    ws1.send_json = AsyncMock()
+    ws1 = FakeWS()
 
     data1 = {"name": player_name}
     await ws_handler._handle_join(ws1, data1)
@@ -394,10 +463,7 @@ async def test_duplicate_name_closes_old_ws_after_registration(ws_handler, game_
     old_token = game_state.players[player_name].session_token
 
     # Create second session with same name
-    ws2 = AsyncMock()
-    ws2.closed = False
-    ws2.close = AsyncMock()
-    ws2.send_json = AsyncMock()
+    ws2 = FakeWS()
 
     data2 = {"name": player_name}
     await ws_handler._handle_join(ws2, data2)
@@ -412,32 +478,9 @@ async def test_duplicate_name_closes_old_ws_after_registration(ws_handler, game_
     assert old_token not in game_state.sessions
     assert new_token in game_state.sessions
 
-    # Give async task time to close old WebSocket
-    await asyncio.sleep(0.1)
-    ws1.close.assert_called_once_with(
-        code=4001,
-        message=b"Session replaced by new connection"
-    )
-
-
-@pytest.mark.asyncio
-async def test_name_with_leading_trailing_spaces_trimmed(ws_handler, game_state, mock_ws):
-    """Test that names with leading/trailing spaces are trimmed correctly."""
-    data = {"name": "  Bob  "}
-
-    await ws_handler._handle_join(mock_ws, data)
-
-    # Verify player added with trimmed name
-    assert "Bob" in game_state.players
-    assert "  Bob  " not in game_state.players
-
-    # Verify success response uses trimmed name
-    mock_ws.send_json.assert_any_call({
-        "type": "join_success",
-        "player_name": "Bob",
-        "session_token": game_state.players["Bob"].session_token,
-        "is_host": False
-    })
+    # Run the background close task to completion
+    await drain_background_tasks(ws_handler)
+    assert ws1.close_calls == [(4001, b"Session replaced by new connection")]
 
 
 @pytest.mark.asyncio
@@ -452,11 +495,10 @@ async def test_session_token_cryptographically_secure(ws_handler, game_state, mo
 
     # Verify token is URL-safe base64 string
     assert isinstance(token, str)
-    # 32 bytes = 256 bits encoded in base64 should be ~43 chars
-    assert len(token) >= 40
+    # 32 bytes = 256 bits encodes to exactly 43 unpadded base64 chars
+    assert len(token) == 43
     # Verify no invalid base64 characters
-    import re
-    assert re.match(r'^[A-Za-z0-9_-]+$', token)
+    assert _URLSAFE_B64_RE.match(token)
 
 
 @pytest.mark.asyncio
@@ -470,10 +512,10 @@ async def test_host_flag_propagated(ws_handler, game_state, mock_ws):
     assert player.is_host is True
 
     # Verify response includes is_host
-    mock_ws.send_json.assert_any_call({
+    assert {
         "type": "join_success",
         "player_name": "Alice",
         "session_token": player.session_token,
         "is_host": True
-    })
+    } in sent_messages(mock_ws)
 
@@ -1,11 +1,24 @@
 """Unit tests for player reconnection functionality (Story 2.5)."""
 import pytest
-from time import time, sleep
+from time import time
 from unittest.mock import Mock
+from custom_components.spyster.game import player as player_module
 from custom_components.spyster.game.player import PlayerSession
 from custom_components.spyster.const import RECONNECT_WINDOW_SECONDS
 
 
+@pytest.fixture
+def advance(monkeypatch):
+    """Drive PlayerSession's wall clock by hand; returns advance(seconds)."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(player_module, "time", lambda: now[0])
+
+    def _advance(seconds: float) -> None:
+        now[0] += seconds
+
+    return _advance
+
+
 class TestPlayerSessionReconnection:
     """Test player session reconnection logic."""
 
@@ -53,7 +66,7 @@ class TestPlayerSessionReconnection:
         # Assert
         assert is_valid is False
 
-    def test_mark_disconnected_sets_timestamp(self):
+    def test_mark_disconnected_sets_timestamp(self, advance):
         """Test disconnect() sets timestamp only on first call."""
         # Arrange
         ws = Mock()
@@ -63,8 +76,8 @@ class TestPlayerSessionReconnection:
         player.disconnect()
         first_timestamp = player.disconnected_at
 
-        # Wait a tiny bit
-        sleep(0.1)
+        # Let the clock move on
+        advance(0.1)
 
         # Act - second disconnect (should not update timestamp)
         player.disconnect()
@@ -75,7 +88,7 @@ class TestPlayerSessionReconnection:
         assert first_timestamp == second_timestamp
         assert player.connected is False
 
-    def test_reconnect_preserves_disconnect_time(self):
+    def test_reconnect_preserves_disconnect_time(self, advance):
         """Test reconnect() does NOT reset disconnect_time."""
         # Arrange
         ws_original = Mock()
@@ -86,8 +99,8 @@ class TestPlayerSessionReconnection:
         player.disconnect()
         original_disconnect_time = player.disconnected_at
 
-        # Wait a bit
-        sleep(0.1)
+        # Let the clock move on
+        advance(0.1)
 
         # Act - reconnect
         player.reconnect(ws_new)
@@ -115,7 +128,7 @@ class TestPlayerSessionReconnection:
         assert is_valid is True
         assert player.connected is True
 
-    def test_multiple_reconnections_preserve_first_disconnect_time(self):
+    def test_multiple_reconnections_preserve_first_disconnect_time(self, advance):
         """Test multiple disconnects/reconnects preserve first disconnect time."""
         # Arrange
         ws1 = Mock()
@@ -127,17 +140,17 @@ class TestPlayerSessionReconnection:
         player.disconnect()
         first_disconnect_time = player.disconnected_at
 
-        sleep(0.1)
+        advance(0.1)
 
         # Reconnect
         player.reconnect(ws2)
 
-        sleep(0.1)
+        advance(0.1)
 
         # Second disconnect (should not update timestamp)
         player.disconnect()
 
-        sleep(0.1)
+        advance(0.1)
 
         # Second reconnect
         player.reconnect(ws3)
@@ -158,7 +171,7 @@ class TestPlayerSessionReconnection:
         # Assert
         assert duration is None
 
-    def test_get_disconnect_duration_returns_elapsed_time(self):
+    def test_get_disconnect_duration_returns_elapsed_time(self, advance):
         """Test get_disconnect_duration() returns elapsed time since disconnect."""
         # Arrange
         ws = Mock()
@@ -167,16 +180,14 @@ class TestPlayerSessionReconnection:
         # Disconnect player
         player.disconnect()
 
-        # Wait a bit
-        sleep(0.2)
+        # Let the clock move on
+        advance(0.2)
 
         # Act
         duration = player.get_disconnect_duration()
 
         # Assert
-        assert duration is not None
-        assert duration >= 0.2  # At least 200ms
-        assert duration < 1.0  # But less than 1 second
+        assert duration == pytest.approx(0.2)
 
     def test_session_expiry_edge_case_exact_300_seconds(self):
         """Test session expires at exactly 300 seconds."""
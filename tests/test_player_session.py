@@ -1,7 +1,7 @@
 """Unit tests for player session management (Story 2.3)."""
 import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
 
 import pytest
 
@@ -12,6 +12,7 @@ from custom_components.spyster.const import (
 )
 from custom_components.spyster.game.player import PlayerSession
 from custom_components.spyster.game.state import GameState
+from tests.helpers import FakeWS
 
 
 class TestPlayerSession:
@@ -256,9 +257,8 @@ class TestGameStateSessionManagement:
         """Test that old WebSocket is closed when duplicate name joins."""
         game_state = GameState()
 
-        # Create mock WebSocket
-        old_ws = AsyncMock()
-        old_ws.closed = False
+        # Create fake WebSocket
+        old_ws = FakeWS()
 
         # Add first player
         _, _, session1 = game_state.add_player("Alice", ws=old_ws)
@@ -271,10 +271,7 @@ class TestGameStateSessionManagement:
         await asyncio.sleep(0.1)
 
         # Old WebSocket should have been closed
-        old_ws.close.assert_called_once_with(
-            code=4001,
-            message=b"Session replaced by new connection"
-        )
+        assert old_ws.close_calls == [(4001, b"Session replaced by new connection")]
 
     def test_player_count_updates(self):
         """Test that player_count is updated correctly."""
@@ -344,3 +341,15 @@ class TestGameStateSessionManagement:
 
         # Timer reference should be cleared
         assert session.disconnect_timer is None
+
+    def test_disconnect_timer_name_cached_and_follows_rename(self):
+        """Test disconnect timer name is reused and rebuilt after a rename."""
+        session = PlayerSession.create_new("HostDisplay", is_host=True)
+
+        first = session.disconnect_timer_name
+        assert first == "disconnect_grace:HostDisplay"
+        assert session.disconnect_timer_name is first
+
+        # Host joining as a player renames the session
+        session.name = "Alice"
+        assert session.disconnect_timer_name == "disconnect_grace:Alice"
@@ -1,12 +1,13 @@
 """Unit tests for QR code generation (Story 1.3)."""
 import base64
 import io
+import json
 import pytest
 from unittest.mock import Mock, patch
 
 from custom_components.spyster.const import ERR_INTERNAL
 from custom_components.spyster.game.state import GameState
-from custom_components.spyster.server.views import SpysterQRView
+from custom_components.spyster.server.views import SpysterQRView, _render_qr_data_url
 
 
 class TestGameStateJoinURL:
@@ -122,6 +123,20 @@ class TestQRCodeGeneration:
 
         assert qr_data_url.startswith("data:image/png;base64,")
 
+    def test_generate_qr_code_is_cached_per_url(self):
+        """Test repeated QR requests for the same URL reuse the rendered image."""
+        _render_qr_data_url.cache_clear()
+        state = GameState()
+        state.create_session("host_123")
+        view = SpysterQRView(state)
+
+        url = state.get_join_url("http://homeassistant.local:8123")
+        first = view.generate_qr_code(url)
+        second = view.generate_qr_code(url)
+
+        assert first is second
+        assert _render_qr_data_url.cache_info().hits == 1
+
 
 class TestQRViewEndpoint:
     """Test SpysterQRView HTTP endpoint."""
@@ -168,14 +183,13 @@ class TestQRViewEndpoint:
         mock_request.app = {"hass": mock_hass}
 
         # Call endpoint
-        with patch("custom_components.spyster.server.views.web.json_response") as mock_response:
-            await view.get(mock_request)
+        response = await view.get(mock_request)
 
-            # Verify error response
-            assert mock_response.called
-            call_args = mock_response.call_args[0][0]
-            assert call_args["error"] is True
-            assert "code" in call_args
+        # Verify error response
+        assert response.status == 400
+        body = json.loads(response.body)
+        assert body["error"] is True
+        assert "code" in body
 
     @pytest.mark.asyncio
     async def test_qr_view_get_without_base_url_returns_error(self):
@@ -191,11 +205,10 @@ class TestQRViewEndpoint:
         mock_request.app = {"hass": mock_hass}
 
         # Call endpoint
-        with patch("custom_components.spyster.server.views.web.json_response") as mock_response:
-            await view.get(mock_request)
+        response = await view.get(mock_request)
 
-            # Verify error response
-            assert mock_response.called
-            call_args = mock_response.call_args[0][0]
-            assert call_args["error"] is True
-            assert call_args["code"] == ERR_INTERNAL
+        # Verify error response
+        assert response.status == 500
+        body = json.loads(response.body)
+        assert body["error"] is True
+        assert body["code"] == ERR_INTERNAL
@@ -55,7 +55,7 @@ def mock_location_pack(monkeypatch):
 
     # Mock the content module
     import custom_components.spyster.game.content as content_module
-    content_module._LOADED_PACKS["classic"] = mock_pack
+    content_module._install_pack("classic", mock_pack)
 
     return mock_pack
 
@@ -187,33 +187,36 @@ def test_assign_roles_complete_flow(game_state, mock_location_pack):
 def test_assign_roles_uses_csprng_for_location(game_state, mock_location_pack, monkeypatch):
     """Test that location selection, spy selection, AND role assignments all use CSPRNG - NFR6."""
     called = []
+    location_draws = []
     original_choice = secrets.choice
+    original_randbelow = secrets.randbelow
 
     def mock_choice(seq):
         called.append(len(seq))
         return original_choice(seq)
 
+    def mock_randbelow(n):
+        location_draws.append(n)
+        return original_randbelow(n)
+
     monkeypatch.setattr(secrets, "choice", mock_choice)
+    monkeypatch.setattr(secrets, "randbelow", mock_randbelow)
 
     game_state.current_round = 1
     game_state.location_pack = "classic"
     assign_roles(game_state)
 
-    # CRITICAL: Should be called for:
-    # 1. Location selection (2 locations in mock pack)
-    # 2. Spy selection (5 connected players)
-    # 3. Role assignments (4 non-spy players, each gets a role via secrets.choice)
-    # Expected calls: 1 (location) + 1 (spy) + 4 (roles) = 6 calls minimum
-    assert len(called) >= 6, f"secrets.choice() must be called for location, spy, AND each role assignment (got {len(called)} calls)"
+    # CRITICAL: Location selection indexes with secrets.randbelow (2 locations
+    # in mock pack); spy selection (5 connected players) and role assignments
+    # (4 non-spy players) each go through secrets.choice
+    assert location_draws == [2], "Location selection should draw from 2 locations"
+    assert len(called) >= 5, f"secrets.choice() must be called for spy AND each role assignment (got {len(called)} calls)"
 
     # Verify we have the expected call patterns
-    # - Location selection: 2 locations
     # - Spy selection: 5 players
-    # - Role assignments: should see calls with 3 items (Beach has 3 roles)
-    assert 2 in called, "Location selection should call with 2 locations"
+    # - Role assignments: should see calls with 3 items (Beach) or 2 (Airplane)
     assert 5 in called, "Spy selection should call with 5 players"
-    # Count role assignment calls (should have 3-item sequences for Beach roles)
-    role_calls = [c for c in called if c == 3]
+    role_calls = [c for c in called if c == len(game_state.current_location["roles"])]
     assert len(role_calls) == 4, f"Should have 4 role assignment calls (got {len(role_calls)})"
 
 
@@ -283,26 +286,17 @@ def test_assign_roles_with_more_players_than_roles(mock_location_pack):
     state.current_round = 1
     state.location_pack = "classic"
 
-    # Force selection of Beach location (which has only 3 roles)
-    import custom_components.spyster.game.content as content_module
-    original_choice = secrets.choice
-
-    def mock_choice_beach(seq):
-        if isinstance(seq, list) and len(seq) > 0 and isinstance(seq[0], dict):
-            if "name" in seq[0]:
-                # This is location selection
-                return mock_location_pack["locations"][0]  # Beach
-        return original_choice(seq)
-
+    # Force selection of Beach location (which has only 3 roles); location
+    # selection is the only secrets.randbelow caller in assign_roles
     import unittest.mock
-    with unittest.mock.patch('secrets.choice', side_effect=mock_choice_beach):
+    with unittest.mock.patch('secrets.randbelow', return_value=0):
         assign_roles(state)
 
     # Should assign roles with repetition (7 non-spy players, 3 available roles)
     assert len(state.player_roles) == 7  # 8 players - 1 spy
 
     # All non-spy players should have roles from Beach location
-    beach_role_names = ["Lifeguard", "Tourist", "Vendor"]
+    beach_role_names = {"Lifeguard", "Tourist", "Vendor"}
     for role in state.player_roles.values():
         assert role["name"] in beach_role_names
 
@@ -327,25 +321,17 @@ def test_assign_roles_fails_with_empty_roles_list(game_state, mock_location_pack
 
     # Create a malformed location with no roles
     import custom_components.spyster.game.content as content_module
-    content_module._LOADED_PACKS["classic"]["locations"].append({
+    mock_location_pack["locations"].append({
         "id": "empty",
         "name": "Empty Location",
         "flavor": "Nothing here",
         "roles": []  # Empty roles list
     })
+    content_module._install_pack("classic", mock_location_pack)
 
-    # Force selection of empty location
-    original_choice = secrets.choice
-
-    def mock_choice_empty(seq):
-        if isinstance(seq, list) and len(seq) > 0 and isinstance(seq[0], dict):
-            if "name" in seq[0]:
-                # Return the empty location
-                return {"id": "empty", "name": "Empty Location", "flavor": "Nothing here", "roles": []}
-        return original_choice(seq)
-
+    # Force selection of empty location (appended last)
     import unittest.mock
-    with unittest.mock.patch('secrets.choice', side_effect=mock_choice_empty):
+    with unittest.mock.patch('secrets.randbelow', side_effect=lambda n: n - 1):
         # Should raise ValueError about no roles
         with pytest.raises(ValueError, match="has no roles defined"):
             assign_roles(game_state)
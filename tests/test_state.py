@@ -49,6 +49,18 @@ def test_game_state_players_dict_starts_empty():
     assert state.players == {}
 
 
+def test_real_player_count_excludes_host_display():
+    """Test real_player_count ignores a HostDisplay entry in players."""
+    from custom_components.spyster.game.player import PlayerSession
+
+    state = GameState()
+    assert state.real_player_count == 0
+
+    state.players["Alice"] = PlayerSession.create_new("Alice", is_host=False)
+    state.players["HostDisplay"] = PlayerSession.create_new("HostDisplay", is_host=True)
+    assert state.real_player_count == 1
+
+
 @pytest.mark.asyncio
 async def test_start_timer_creates_timer():
     """Test that start_timer creates a timer task."""
@@ -3,7 +3,12 @@ import pytest
 from unittest.mock import Mock, patch
 import os
 
-from custom_components.spyster.server import register_static_paths
+from custom_components.spyster.server import (
+    StaticCSSView,
+    StaticJSView,
+    StaticVendorJSView,
+    register_static_paths,
+)
 
 
 class TestStaticFileRegistration:
@@ -68,6 +73,23 @@ class TestStaticFileRegistration:
                 mock_join.assert_called_once_with(component_dir, "www")
 
 
+class TestStaticViewPathTraversal:
+    """Tests for path traversal rejection in static views."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("view_cls", [StaticCSSView, StaticJSView, StaticVendorJSView])
+    @pytest.mark.parametrize("filename", ["", "../manifest.json", "a/b.js", "x\x00.js"])
+    async def test_forbidden_filename_rejected_before_stat(self, view_cls, filename):
+        """Test that unsafe filenames return 403 without a filesystem lookup."""
+        view = view_cls()
+
+        with patch("pathlib.Path.exists") as mock_exists:
+            response = await view.get(Mock(), filename)
+
+        assert response.status == 403
+        mock_exists.assert_not_called()
+
+
 class TestStaticFilePaths:
     """Tests for expected static file paths."""
 
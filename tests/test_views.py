@@ -4,7 +4,28 @@ from aiohttp import web
 from unittest.mock import Mock, patch, mock_open
 from pathlib import Path
 
-from custom_components.spyster.server.views import HostView, PlayerView
+from custom_components.spyster.server.views import (
+    HostView,
+    PlayerView,
+    _get_version,
+    _inject_cache_bust,
+)
+
+
+def test_inject_cache_bust_versions_static_urls():
+    """Test cache busting rewrites static asset URLs on raw bytes."""
+    html = (
+        b'<link href="/api/spyster/static/css/styles.css">'
+        b"<script src='/api/spyster/static/js/vendor/qrcode.min.js'></script>"
+        b'<a href="/api/spyster/player">'
+    )
+    version = _get_version().encode("utf-8")
+
+    result = _inject_cache_bust(html)
+
+    assert b'/api/spyster/static/css/styles.css?v=' + version + b'"' in result
+    assert b"/api/spyster/static/js/vendor/qrcode.min.js?v=" + version + b"'" in result
+    assert b'<a href="/api/spyster/player">' in result
 
 
 @pytest.mark.asyncio
@@ -14,7 +35,7 @@ async def test_host_view_returns_html():
     request = Mock(spec=web.Request)
 
     # Mock the file reading
-    html_content = """<!DOCTYPE html>
+    html_content = b"""<!DOCTYPE html>
 <html>
 <head><title>Spyster - Host Display</title></head>
 <body>
@@ -53,7 +74,7 @@ async def test_player_view_returns_html():
     request = Mock(spec=web.Request)
 
     # Mock the file reading
-    html_content = """<!DOCTYPE html>
+    html_content = b"""<!DOCTYPE html>
 <html>
 <head><title>Spyster - Player</title></head>
 <body>
@@ -19,6 +19,75 @@ from custom_components.spyster.game.state import GameState
 from custom_components.spyster.server.websocket import WebSocketHandler
 
 
+async def wait_until(condition, what: str) -> None:
+    """Yield to the loop until condition() holds, failing after a bounded wait.
+
+    Frames go out from each connection's writer task, so a queued frame takes
+    at least one loop pass to reach the socket.
+    """
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError(f"timed out waiting for {what}")
+
+
+async def wait_for_sends(send_str: AsyncMock, count: int) -> None:
+    """Yield to the loop until a mocked send_str has been awaited count times."""
+    await wait_until(
+        lambda: send_str.await_count >= count, f"{count} awaited send_str calls"
+    )
+
+
+async def flush_scheduled_broadcasts(ws_handler: WebSocketHandler) -> None:
+    """Run a call_soon-scheduled broadcast and wait for its task to finish."""
+    await asyncio.sleep(0)
+    await asyncio.gather(*ws_handler._background_tasks)
+
+
+class ManualSleep:
+    """Stand-in for asyncio.sleep that lets a test step timer ticks by hand.
+
+    Zero-delay sleeps pass straight through to the real asyncio.sleep, so
+    plain yields to the loop keep working while it is installed.
+    """
+
+    def __init__(self) -> None:
+        self.delays: list[float] = []
+        self._real_sleep = asyncio.sleep
+        self._wakeup: asyncio.Future | None = None
+
+    async def __call__(self, delay: float, result=None):
+        if delay <= 0:
+            return await self._real_sleep(0, result)
+        self.delays.append(delay)
+        self._wakeup = asyncio.get_running_loop().create_future()
+        await self._wakeup
+        return result
+
+    async def until_sleeping(self) -> None:
+        """Yield until some task is parked in a timed sleep."""
+        for _ in range(100):
+            if self._wakeup is not None and not self._wakeup.done():
+                return
+            await self._real_sleep(0)
+        raise AssertionError("no task entered a timed sleep")
+
+    async def tick(self) -> None:
+        """End the pending sleep and run the sleeper until it sleeps again."""
+        await self.until_sleeping()
+        self._wakeup.set_result(None)
+        await self.until_sleeping()
+
+
+@pytest.fixture
+def manual_sleep(monkeypatch):
+    """Replace asyncio.sleep with a ManualSleep for the test."""
+    sleeper = ManualSleep()
+    monkeypatch.setattr(asyncio, "sleep", sleeper)
+    return sleeper
+
+
 class TestWebSocketHandler(AioHTTPTestCase):
     """Test WebSocket connection handling."""
 
@@ -56,6 +125,19 @@ class TestWebSocketHandler(AioHTTPTestCase):
         # After context exit, connection should be cleaned up
         assert len(self.handler._connections) == 0
 
+    @unittest_run_loop
+    async def test_player_mapping_dropped_on_disconnect(self):
+        """Test the ws-to-player mapping is removed when the socket closes."""
+        async with self.client.ws_connect("/ws") as ws:
+            await ws.receive_json()  # Welcome message
+            await ws.send_json({"type": "join", "name": "Alice"})
+            msg = await ws.receive_json()
+            assert msg["type"] == "join_success"
+            assert len(self.handler._ws_to_player) == 1
+
+        assert self.handler._ws_to_player == {}
+        assert self.handler._out_queues == {}
+
     @unittest_run_loop
     async def test_invalid_json(self):
         """Test malformed JSON triggers error response."""
@@ -329,13 +411,13 @@ class TestDisconnectDetection:
         player1.connected = True
         player1.ws = MagicMock()
         player1.ws.closed = False
-        player1.ws.send_json = AsyncMock()
+        player1.ws.send_str = AsyncMock()
 
         player2 = PlayerSession.create_new("Bob", is_host=False)
         player2.connected = False
         player2.ws = MagicMock()
         player2.ws.closed = False
-        player2.ws.send_json = AsyncMock()
+        player2.ws.send_str = AsyncMock()
 
         mock_game_state.players["Alice"] = player1
         mock_game_state.players["Bob"] = player2
@@ -400,6 +482,7 @@ async def test_timer_broadcast_loop_runs():
     mock_game_state = MagicMock()
     mock_game_state.phase = GamePhase.QUESTIONING
     mock_game_state.players = {}
+    mock_game_state.get_active_timer_remaining.return_value = None
     
     # Create WebSocket handler
     ws_handler = WebSocketHandler(mock_game_state)
@@ -458,3 +541,469 @@ async def test_questioning_phase_includes_timer_in_broadcast():
     
     # Cleanup
     game_state.cancel_all_timers()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_state_slow_client_does_not_block_others():
+    """Test broadcast queues frames so slow or failing clients don't block others."""
+    from custom_components.spyster.game.state import GamePhase
+
+    game_state = GameState()
+    game_state.phase = GamePhase.LOBBY
+    ws_handler = WebSocketHandler(game_state)
+
+    release = asyncio.Event()
+
+    async def slow_send(payload):
+        await release.wait()
+
+    names = ("Slow", "Broken", "Fast")
+    for name in names:
+        player = PlayerSession.create_new(name, is_host=False)
+        player.ws = MagicMock()
+        player.ws.closed = False
+        player.ws.send_str = AsyncMock()
+        player.ws.close = AsyncMock()
+        game_state.players[name] = player
+        ws_handler._ws_to_player[player.ws] = player
+
+    game_state.players["Slow"].ws.send_str.side_effect = slow_send
+    game_state.players["Broken"].ws.send_str.side_effect = ConnectionResetError()
+
+    # Broadcast returns without waiting on any socket
+    await ws_handler.broadcast_state()
+    broken_ws = game_state.players["Broken"].ws
+    await wait_for_sends(game_state.players["Fast"].ws.send_str, 1)
+    await wait_until(lambda: broken_ws.close.await_count, "broken socket close")
+
+    # Fast client is served while the slow one is still pending
+    assert game_state.players["Fast"].ws.send_str.called
+    assert not ws_handler._writer_tasks[game_state.players["Slow"].ws].done()
+
+    # Broken client's writer stopped and its connection was closed
+    assert game_state.players["Broken"].ws not in ws_handler._writer_tasks
+    game_state.players["Broken"].ws.close.assert_awaited()
+
+    release.set()
+    for ws in list(ws_handler._writer_tasks):
+        ws_handler._close_outbox(ws)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_state_drops_client_with_full_queue():
+    """Test a client that cannot drain its outbound queue is disconnected."""
+    from custom_components.spyster.const import OUTBOUND_QUEUE_SIZE
+    from custom_components.spyster.game.state import GamePhase
+
+    game_state = GameState()
+    game_state.phase = GamePhase.LOBBY
+    ws_handler = WebSocketHandler(game_state)
+
+    stuck = asyncio.Event()
+
+    async def stuck_send(payload):
+        await stuck.wait()
+
+    player = PlayerSession.create_new("Alice", is_host=False)
+    player.ws = MagicMock()
+    player.ws.closed = False
+    player.ws.send_str = AsyncMock(side_effect=stuck_send)
+    player.ws.close = AsyncMock()
+    game_state.players["Alice"] = player
+    ws_handler._ws_to_player[player.ws] = player
+
+    # One frame is in flight, the rest fill the queue, then one more overflows
+    for round_number in range(OUTBOUND_QUEUE_SIZE + 2):
+        game_state.current_round = round_number
+        await ws_handler.broadcast_state()
+        await asyncio.sleep(0)
+    await wait_until(lambda: player.ws.close.await_count, "slow client close")
+
+    player.ws.close.assert_awaited()
+    assert player.ws not in ws_handler._out_queues
+
+
+@pytest.mark.asyncio
+async def test_broadcast_state_serializes_shared_phase_once():
+    """Test LOBBY broadcasts build state once and send one frame to all."""
+    from custom_components.spyster.game.state import GamePhase
+
+    game_state = GameState()
+    game_state.phase = GamePhase.LOBBY
+    ws_handler = WebSocketHandler(game_state)
+
+    for name in ("Alice", "Bob", "Carol"):
+        player = PlayerSession.create_new(name, is_host=False)
+        player.ws = MagicMock()
+        player.ws.closed = False
+        player.ws.send_str = AsyncMock()
+        game_state.players[name] = player
+        ws_handler._ws_to_player[player.ws] = player
+
+    with patch.object(game_state, "get_state", wraps=game_state.get_state) as get_state:
+        await ws_handler.broadcast_state()
+    for player in game_state.players.values():
+        await wait_for_sends(player.ws.send_str, 1)
+
+    get_state.assert_called_once_with(for_player=None)
+    frames = {p.ws.send_str.call_args[0][0] for p in game_state.players.values()}
+    assert len(frames) == 1
+    assert json.loads(frames.pop())["type"] == "state"
+
+
+@pytest.mark.asyncio
+async def test_timer_broadcast_loop_skips_unchanged_ticks(manual_sleep):
+    """Test timer loop does not rebroadcast when phase and second are unchanged."""
+    from custom_components.spyster.game.state import GamePhase
+
+    mock_game_state = MagicMock()
+    mock_game_state.phase = GamePhase.QUESTIONING
+    mock_game_state.players = {}
+    mock_game_state.get_active_timer_remaining.return_value = None
+
+    ws_handler = WebSocketHandler(mock_game_state)
+    # A broadcast already delivered this (phase, remaining) to clients
+    ws_handler._last_broadcast_key = (GamePhase.QUESTIONING, None)
+    ws_handler.broadcast_state = AsyncMock()
+
+    await ws_handler.start_timer_broadcasts()
+    await manual_sleep.tick()
+    await manual_sleep.tick()
+
+    # Two ticks elapsed (the loop is parked in its third sleep) with no resend
+    assert manual_sleep.delays == [1.0, 1.0, 1.0]
+    assert ws_handler.broadcast_state.call_count == 0
+
+    await ws_handler.stop_timer_broadcasts()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_state_skips_unmapped_and_replaced_sockets():
+    """Test broadcast only reaches live sockets owned by current players."""
+    from custom_components.spyster.game.state import GamePhase
+
+    game_state = GameState()
+    game_state.phase = GamePhase.LOBBY
+    ws_handler = WebSocketHandler(game_state)
+
+    def make_ws():
+        ws = MagicMock()
+        ws.closed = False
+        ws.send_str = AsyncMock()
+        return ws
+
+    # Live player
+    alice = PlayerSession.create_new("Alice", is_host=False)
+    alice.ws = make_ws()
+    game_state.players["Alice"] = alice
+    ws_handler._ws_to_player[alice.ws] = alice
+
+    # Disconnected player: session still holds a socket but it is not mapped
+    bob = PlayerSession.create_new("Bob", is_host=False)
+    bob.ws = make_ws()
+    game_state.players["Bob"] = bob
+
+    # Replaced session: old socket still mapped to the stale session
+    stale_ws = make_ws()
+    stale = PlayerSession.create_new("Carol", is_host=False)
+    ws_handler._ws_to_player[stale_ws] = stale
+    carol = PlayerSession.create_new("Carol", is_host=False)
+    carol.ws = make_ws()
+    game_state.players["Carol"] = carol
+    ws_handler._ws_to_player[carol.ws] = carol
+
+    await ws_handler.broadcast_state()
+    await wait_for_sends(alice.ws.send_str, 1)
+    await wait_for_sends(carol.ws.send_str, 1)
+
+    assert alice.ws.send_str.called
+    assert carol.ws.send_str.called
+    assert not bob.ws.send_str.called
+    assert not stale_ws.send_str.called
+
+    for ws in list(ws_handler._writer_tasks):
+        ws_handler._close_outbox(ws)
+
+
+@pytest.mark.asyncio
+async def test_writer_sends_only_latest_queued_state():
+    """Test state frames queued behind a slow send collapse to the newest."""
+    from custom_components.spyster.game.state import GamePhase
+
+    game_state = GameState()
+    game_state.phase = GamePhase.LOBBY
+    ws_handler = WebSocketHandler(game_state)
+
+    release = asyncio.Event()
+    sent = []
+
+    async def send_str(frame):
+        sent.append(frame)
+        if len(sent) == 1:
+            await release.wait()
+
+    player = PlayerSession.create_new("Alice", is_host=False)
+    player.ws = MagicMock()
+    player.ws.closed = False
+    player.ws.send_str = AsyncMock(side_effect=send_str)
+    game_state.players["Alice"] = player
+    ws_handler._ws_to_player[player.ws] = player
+
+    # First frame is in flight; three more queue up behind it
+    await ws_handler.broadcast_state()
+    await asyncio.sleep(0)
+    for round_number in (1, 2, 3):
+        game_state.current_round = round_number
+        await ws_handler.broadcast_state()
+
+    release.set()
+    await wait_for_sends(player.ws.send_str, 2)
+
+    assert len(sent) == 2
+    assert json.loads(sent[0])["type"] == "state"
+    latest = json.loads(sent[1])
+    assert latest["type"] == "state"
+    assert latest["current_round"] == 3
+
+    ws_handler._close_outbox(player.ws)
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_frame_skips_json_parsing():
+    """Test the canonical heartbeat frame is handled without decoding JSON."""
+    ws_handler = WebSocketHandler(GameState())
+    ws_handler._handle_heartbeat = AsyncMock()
+    ws = MagicMock()
+
+    with patch(
+        "custom_components.spyster.server.websocket.orjson.loads"
+    ) as loads:
+        await ws_handler._handle_text_message(ws, 1, '{"type":"heartbeat"}')
+
+    loads.assert_not_called()
+    ws_handler._handle_heartbeat.assert_awaited_once_with(1, ws)
+
+
+@pytest.mark.asyncio
+async def test_timer_broadcast_loop_idles_until_timed_phase(manual_sleep):
+    """Test timer loop waits on GameState outside QUESTIONING/VOTE."""
+    from custom_components.spyster.game.state import GamePhase
+
+    game_state = GameState()
+    ws_handler = WebSocketHandler(game_state)
+    ws_handler.broadcast_state = AsyncMock()
+
+    await ws_handler.start_timer_broadcasts()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    # Parked on the timed-phase event, not ticking
+    assert game_state.in_timed_phase is False
+    assert manual_sleep.delays == []
+    assert ws_handler.broadcast_state.call_count == 0
+
+    game_state.phase = GamePhase.QUESTIONING
+    assert game_state.in_timed_phase is True
+    await manual_sleep.until_sleeping()
+    assert manual_sleep.delays == [1.0]
+    assert ws_handler.broadcast_state.call_count == 0
+
+    await manual_sleep.tick()
+    assert ws_handler.broadcast_state.call_count == 1
+
+    await ws_handler.stop_timer_broadcasts()
+
+
+@pytest.mark.asyncio
+async def test_on_disconnect_skips_grace_timer_for_stale_sessions():
+    """Test no grace timer is armed for sessions that are not live players."""
+    game_state = GameState()
+    ws_handler = WebSocketHandler(game_state)
+
+    # Host display is never stored in players
+    host_display = PlayerSession.create_new("HostDisplay", is_host=True)
+    await ws_handler._on_disconnect(host_display)
+
+    # Old socket closes after the session was restored onto a new one
+    alice = PlayerSession.create_new("Alice", is_host=False)
+    alice.ws = MagicMock()
+    game_state.players["Alice"] = alice
+    ws_handler._ws_to_player[alice.ws] = alice
+    await ws_handler._on_disconnect(alice)
+
+    assert game_state._timers == {}
+    assert alice.disconnect_timer is None
+
+
+@pytest.mark.asyncio
+async def test_final_vote_broadcasts_once():
+    """Test the vote that completes voting emits a single REVEAL broadcast."""
+    from custom_components.spyster.game.state import GamePhase
+
+    game_state = MagicMock()
+    game_state.phase = GamePhase.VOTE
+    game_state.record_vote.return_value = (True, None)
+    game_state._all_votes_submitted.return_value = True
+
+    ws_handler = WebSocketHandler(game_state)
+    ws_handler.broadcast_state = AsyncMock()
+
+    ws = MagicMock()
+    ws_handler._ws_to_player[ws] = PlayerSession.create_new("Alice", is_host=False)
+
+    await ws_handler._handle_vote(ws, {"target": "Bob", "confidence": 1})
+    await flush_scheduled_broadcasts(ws_handler)
+
+    assert game_state.phase == GamePhase.REVEAL
+    ws_handler.broadcast_state.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_state_skips_unchanged_frames():
+    """Test a connection is not re-sent a state identical to its last one."""
+    from custom_components.spyster.game.state import GamePhase
+
+    game_state = GameState()
+    game_state.phase = GamePhase.LOBBY
+    ws_handler = WebSocketHandler(game_state)
+
+    player = PlayerSession.create_new("Alice", is_host=False)
+    player.ws = MagicMock()
+    player.ws.closed = False
+    player.ws.send_str = AsyncMock()
+    game_state.players["Alice"] = player
+    ws_handler._ws_to_player[player.ws] = player
+
+    await ws_handler.broadcast_state()
+    await wait_for_sends(player.ws.send_str, 1)
+    await ws_handler.broadcast_state()
+    assert ws_handler._out_queues[player.ws].empty()
+    assert player.ws.send_str.await_count == 1
+
+    game_state.current_round = 1
+    await ws_handler.broadcast_state()
+    await wait_for_sends(player.ws.send_str, 2)
+    assert player.ws.send_str.await_count == 2
+
+    ws_handler._close_outbox(player.ws)
+
+
+@pytest.mark.asyncio
+async def test_host_join_rejects_non_host_with_static_frame():
+    """Test host_join_as_player failures use the pre-serialized frames."""
+    ws_handler = WebSocketHandler(GameState())
+    ws = MagicMock()
+    ws.send_str = AsyncMock()
+    ws_handler._ws_to_player[ws] = PlayerSession.create_new("Alice", is_host=False)
+
+    await ws_handler._handle_host_join_as_player(ws, {"name": "Alice"})
+
+    response = json.loads(ws.send_str.call_args[0][0])
+    assert response == {
+        "type": "host_join_response",
+        "success": False,
+        "error": "Only the host can use this feature",
+    }
+
+
+@pytest.mark.asyncio
+async def test_admin_unknown_action_returns_error():
+    """Test admin actions missing from the dispatch table are rejected."""
+    game_state = GameState()
+    ws_handler = WebSocketHandler(game_state)
+    ws = MagicMock()
+    ws.send_str = AsyncMock()
+    host = PlayerSession.create_new("Host", is_host=True)
+    ws_handler._ws_to_player[ws] = host
+
+    await ws_handler._handle_admin(ws, {"type": "admin", "action": "self_destruct"})
+
+    response = json.loads(ws.send_str.call_args[0][0])
+    assert response["type"] == "error"
+    assert response["code"] == ERR_INVALID_MESSAGE
+
+
+@pytest.mark.asyncio
+async def test_schedule_broadcast_coalesces_within_one_tick():
+    """Test broadcasts requested before the loop turns share one send."""
+    ws_handler = WebSocketHandler(GameState())
+    ws_handler.broadcast_state = AsyncMock()
+
+    for _ in range(3):
+        ws_handler._schedule_broadcast()
+    await flush_scheduled_broadcasts(ws_handler)
+    assert ws_handler.broadcast_state.await_count == 1
+
+    ws_handler._schedule_broadcast()
+    await flush_scheduled_broadcasts(ws_handler)
+    assert ws_handler.broadcast_state.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_scheduled_broadcast():
+    """Test a call_soon broadcast requested before unload never fires."""
+    ws_handler = WebSocketHandler(GameState())
+    ws_handler.broadcast_state = AsyncMock()
+
+    ws_handler._schedule_broadcast()
+    pending = ws_handler._broadcast_pending
+
+    await ws_handler.shutdown()
+    await asyncio.sleep(0)
+
+    assert pending.cancelled()
+    assert ws_handler._broadcast_pending is None
+    ws_handler.broadcast_state.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_lobby_broadcast_failure_is_logged(caplog):
+    """Test a failing coalesced broadcast is tracked and its error logged."""
+    ws_handler = WebSocketHandler(GameState())
+    ws_handler.broadcast_state = AsyncMock(side_effect=RuntimeError("boom"))
+
+    ws_handler._flush_lobby_broadcast()
+    assert len(ws_handler._background_tasks) == 1
+    await asyncio.gather(*ws_handler._background_tasks, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert ws_handler._background_tasks == set()
+    assert "Background task spyster_broadcast failed: boom" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_scheduled_lobby_broadcast():
+    """Test a lobby broadcast armed before unload never fires."""
+    ws_handler = WebSocketHandler(GameState())
+    ws_handler.broadcast_state = AsyncMock()
+
+    ws_handler._schedule_lobby_broadcast()
+    pending = ws_handler._lobby_broadcast_pending
+
+    await ws_handler.shutdown()
+
+    assert pending.cancelled()
+    assert ws_handler._lobby_broadcast_pending is None
+    ws_handler.broadcast_state.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_slow_client_close_failure_is_logged(caplog):
+    """Test a failing close of an overflowing client is observed and logged."""
+    from custom_components.spyster.const import OUTBOUND_QUEUE_SIZE
+
+    ws_handler = WebSocketHandler(GameState())
+    ws = MagicMock()
+    ws.closed = False
+    ws.close = AsyncMock(side_effect=ConnectionResetError("gone"))
+    # Fill the queue without a writer draining it
+    ws_handler._out_queues[ws] = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+    for i in range(OUTBOUND_QUEUE_SIZE):
+        ws_handler._out_queues[ws].put_nowait(f"frame{i}")
+
+    assert ws_handler._queue_frame(ws, "overflow", "Alice") is False
+    await asyncio.gather(*ws_handler._background_tasks, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    ws.close.assert_awaited_once()
+    assert ws_handler._background_tasks == set()
+    assert "spyster_close_slow_client:Alice failed: gone" in caplog.text